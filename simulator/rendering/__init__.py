@@ -14,6 +14,7 @@ from .patterns import (
     Pattern,
     pattern_test,
     fill_polygon_pattern,
+    fill_rect_pattern,
 )
 from .bezier import (
     auto_tangent,
@@ -28,7 +29,9 @@ from .vector_font import (
     GLYPHS,
     NUMERALS,
     render_numeral,
+    render_numeral_batch,
     render_string,
+    render_string_cached,
     render_string_centered,
     render_string_right,
     render_multiline,
@@ -66,6 +69,7 @@ __all__ = [
     "Pattern",
     "pattern_test",
     "fill_polygon_pattern",
+    "fill_rect_pattern",
     "auto_tangent",
     "cubic_bezier",
     "cubic_bezier_derivative",
@@ -76,7 +80,9 @@ __all__ = [
     "GLYPHS",
     "NUMERALS",
     "render_numeral",
+    "render_numeral_batch",
     "render_string",
+    "render_string_cached",
     "render_string_centered",
     "render_string_right",
     "render_multiline",
@@ -0,0 +1,16 @@
+"""
+Helpers shared by the rendering test modules.
+
+Kept to features available on the simulator's minimum Python (3.9), so
+popcounts use bin().count() rather than int.bit_count().
+"""
+
+
+def count_set_bits(data) -> int:
+    """Count the 1 bits in a bytes-like object in one pass."""
+    return bin(int.from_bytes(data, 'big')).count('1')
+
+
+def count_pixels(fb) -> int:
+    """Count black pixels in one pass over the packed buffer."""
+    return count_set_bits(fb.buffer)
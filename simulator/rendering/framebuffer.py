@@ -9,6 +9,27 @@ Color convention: True/1 = black, False/0 = white.
 """
 
 
+# Partial-byte masks indexed by bit position within a byte (0 = leftmost).
+# _LEFT_MASK[n] covers pixels n..7, _RIGHT_MASK[n] covers pixels 0..n.
+_LEFT_MASK = [0xFF, 0x7F, 0x3F, 0x1F, 0x0F, 0x07, 0x03, 0x01]
+_RIGHT_MASK = [0x80, 0xC0, 0xE0, 0xF0, 0xF8, 0xFC, 0xFE, 0xFF]
+
+# Single-pixel masks indexed by x & 7 (bit 7 = leftmost pixel)
+_PIXEL_MASK = [0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01]
+
+# One row of full bytes per color; fill_span slices these instead of
+# looping over bytes (the Python equivalent of memset)
+_BLACK_ROW = b"\xff" * 50
+_WHITE_ROW = bytes(50)
+
+# Byte translation table that flips all 8 pixels of a byte
+_INVERT = bytes(255 - i for i in range(256))
+
+# Whole-buffer sources for clear(): one memcpy per call, no allocation
+_ALL_BLACK = b"\xff" * 15000
+_ALL_WHITE = bytes(15000)
+
+
 class Framebuffer:
     """
     1-bit packed pixel framebuffer for 400x300 display.
@@ -38,9 +59,22 @@ class Framebuffer:
         Args:
             color: True for black (all 1s), False for white (all 0s).
         """
-        fill_value = 0xFF if color else 0x00
-        for i in range(len(self.buffer)):
-            self.buffer[i] = fill_value
+        # Same-length slice assignment is a single memcpy, the Python
+        # counterpart of the C++ Framebuffer::clear() memset. The buffer is
+        # deliberately not re-sliced to a 64-byte boundary: alignment made
+        # no measurable difference to a 15 KB copy and would turn `buffer`
+        # into a memoryview.
+        self.buffer[:] = _ALL_BLACK if color else _ALL_WHITE
+
+    def is_empty(self) -> bool:
+        """
+        Check whether every pixel is white.
+
+        Returns:
+            True if no pixel is set, False otherwise.
+        """
+        # Compares against a cached all-white buffer (a single memcmp)
+        return self.buffer == _ALL_WHITE
 
     def set_pixel(self, x: int, y: int, color: bool) -> None:
         """
@@ -51,16 +85,15 @@ class Framebuffer:
             y: Y coordinate (0-299)
             color: True for black, False for white
         """
-        if x < 0 or x >= self.WIDTH or y < 0 or y >= self.HEIGHT:
+        if not (0 <= x < self.WIDTH and 0 <= y < self.HEIGHT):
             return
 
         byte_index = y * self.BYTES_PER_ROW + (x >> 3)
-        bit_index = 7 - (x & 7)  # Bit 7 = leftmost pixel
 
         if color:
-            self.buffer[byte_index] |= (1 << bit_index)
+            self.buffer[byte_index] |= _PIXEL_MASK[x & 7]
         else:
-            self.buffer[byte_index] &= ~(1 << bit_index)
+            self.buffer[byte_index] &= ~_PIXEL_MASK[x & 7]
 
     def get_pixel(self, x: int, y: int) -> bool:
         """
@@ -73,13 +106,38 @@ class Framebuffer:
         Returns:
             True for black, False for white. Returns False if out of bounds.
         """
-        if x < 0 or x >= self.WIDTH or y < 0 or y >= self.HEIGHT:
+        if not (0 <= x < self.WIDTH and 0 <= y < self.HEIGHT):
             return False
 
         byte_index = y * self.BYTES_PER_ROW + (x >> 3)
-        bit_index = 7 - (x & 7)  # Bit 7 = leftmost pixel
+        return bool(self.buffer[byte_index] & _PIXEL_MASK[x & 7])
+
+    def get_row_bytes(self, y: int, x_start: int, x_end: int) -> bytes:
+        """
+        Read the packed bytes covering a horizontal run of pixels.
+
+        Returns every byte that contains a pixel in [x_start, x_end), so
+        the first and last bytes may include neighbouring pixels. Useful
+        for checking a run 8 pixels at a time.
+
+        Args:
+            y: Row (0-299)
+            x_start: Starting X coordinate (inclusive)
+            x_end: Ending X coordinate (exclusive)
+
+        Returns:
+            The covering bytes, or b"" if the run is out of bounds or empty.
+        """
+        if not 0 <= y < self.HEIGHT:
+            return b""
+
+        x_start = max(0, x_start)
+        x_end = min(self.WIDTH, x_end)
+        if x_start >= x_end:
+            return b""
 
-        return bool(self.buffer[byte_index] & (1 << bit_index))
+        row_offset = y * self.BYTES_PER_ROW
+        return bytes(self.buffer[row_offset + (x_start >> 3):row_offset + ((x_end + 7) >> 3)])
 
     def fill_span(self, y: int, x_start: int, x_end: int, color: bool) -> None:
         """
@@ -87,6 +145,9 @@ class Framebuffer:
 
         Fills pixels from x_start (inclusive) to x_end (exclusive).
         Uses full-byte writes where possible for 8x speedup over pixel-by-pixel.
+        Dispatches to a color-specialized implementation; callers filling
+        many spans of one color can bind _fill_span_set/_fill_span_clear
+        directly to skip the dispatch.
 
         Args:
             y: Y coordinate (0-299)
@@ -94,8 +155,15 @@ class Framebuffer:
             x_end: Ending X coordinate (exclusive)
             color: True for black, False for white
         """
+        if color:
+            self._fill_span_set(y, x_start, x_end)
+        else:
+            self._fill_span_clear(y, x_start, x_end)
+
+    def _fill_span_set(self, y: int, x_start: int, x_end: int) -> None:
+        """fill_span specialized for black: only ORs masks into the row."""
         # Bounds check on y
-        if y < 0 or y >= self.HEIGHT:
+        if not 0 <= y < self.HEIGHT:
             return
 
         # Clamp x coordinates to valid range
@@ -108,63 +176,119 @@ class Framebuffer:
         if x_start >= x_end:
             return
 
+        buf = self.buffer
         row_offset = y * self.BYTES_PER_ROW
 
-        # Calculate byte boundaries
-        start_byte = x_start >> 3
-        end_byte = (x_end - 1) >> 3  # Byte containing the last pixel
+        # Full row: one slice assignment, no edge masks
+        if x_start == 0 and x_end == self.WIDTH:
+            buf[row_offset:row_offset + self.BYTES_PER_ROW] = _BLACK_ROW
+            return
 
-        start_bit = x_start & 7  # Bit position within start byte (0-7)
-        end_bit = (x_end - 1) & 7  # Bit position of last pixel within end byte
+        # Byte indices of the first and last pixel in the span
+        start_idx = row_offset + (x_start >> 3)
+        end_idx = row_offset + ((x_end - 1) >> 3)
 
-        if start_byte == end_byte:
+        left = _LEFT_MASK[x_start & 7]
+        right = _RIGHT_MASK[(x_end - 1) & 7]
+
+        if start_idx == end_idx:
             # All pixels are in the same byte
-            # Create mask for bits from start_bit to end_bit (inclusive)
-            # Bit 7 = leftmost, so we need bits (7-start_bit) down to (7-end_bit)
-            mask = 0
-            for bit in range(start_bit, end_bit + 1):
-                mask |= (1 << (7 - bit))
-
-            byte_idx = row_offset + start_byte
-            if color:
-                self.buffer[byte_idx] |= mask
-            else:
-                self.buffer[byte_idx] &= ~mask
-        else:
-            # Span crosses multiple bytes
-            # Track the range of full bytes to fill
-            first_full_byte = start_byte
-            last_full_byte = end_byte
-
-            # Handle partial start byte (if not byte-aligned)
-            if start_bit != 0:
-                # Mask for bits from start_bit to 7 (rightward to end of byte)
-                # These are bits (7-start_bit) down to 0
-                mask = (1 << (8 - start_bit)) - 1
-                byte_idx = row_offset + start_byte
-                if color:
-                    self.buffer[byte_idx] |= mask
-                else:
-                    self.buffer[byte_idx] &= ~mask
-                first_full_byte = start_byte + 1
-
-            # Handle partial end byte (if not byte-aligned)
-            # end_bit is the bit position of the last pixel to fill
-            # We need to fill bits 0 through end_bit (inclusive)
-            if end_bit != 7:
-                # Mask for bits from 0 to end_bit (leftward from start of byte)
-                # These are bits 7 down to (7-end_bit), mask to 8 bits
-                mask = (0xFF << (7 - end_bit)) & 0xFF
-                byte_idx = row_offset + end_byte
-                if color:
-                    self.buffer[byte_idx] |= mask
-                else:
-                    self.buffer[byte_idx] &= ~mask
-                last_full_byte = end_byte - 1
-
-            # Fill full bytes in the middle (the fast path)
-            if first_full_byte <= last_full_byte:
-                fill_value = 0xFF if color else 0x00
-                for byte_idx in range(row_offset + first_full_byte,
-                                      row_offset + last_full_byte + 1):
-                    self.buffer[byte_idx] = fill_value
+            buf[start_idx] |= left & right
+            return
+
+        # Partial (or full) edge bytes, then the full-byte run as a memset
+        buf[start_idx] |= left
+        buf[end_idx] |= right
+        run = end_idx - start_idx - 1
+        if run > 0:
+            buf[start_idx + 1:end_idx] = _BLACK_ROW[:run]
+
+    def _fill_span_clear(self, y: int, x_start: int, x_end: int) -> None:
+        """fill_span specialized for white: only ANDs inverse masks into the row."""
+        # Bounds check on y
+        if not 0 <= y < self.HEIGHT:
+            return
+
+        # Clamp x coordinates to valid range
+        if x_start < 0:
+            x_start = 0
+        if x_end > self.WIDTH:
+            x_end = self.WIDTH
+
+        # Empty or invalid span
+        if x_start >= x_end:
+            return
+
+        buf = self.buffer
+        row_offset = y * self.BYTES_PER_ROW
+
+        # Full row: one slice assignment, no edge masks
+        if x_start == 0 and x_end == self.WIDTH:
+            buf[row_offset:row_offset + self.BYTES_PER_ROW] = _WHITE_ROW
+            return
+
+        # Byte indices of the first and last pixel in the span
+        start_idx = row_offset + (x_start >> 3)
+        end_idx = row_offset + ((x_end - 1) >> 3)
+
+        left = _LEFT_MASK[x_start & 7]
+        right = _RIGHT_MASK[(x_end - 1) & 7]
+
+        if start_idx == end_idx:
+            # All pixels are in the same byte
+            buf[start_idx] &= ~(left & right)
+            return
+
+        # Partial (or full) edge bytes, then the full-byte run as a memset
+        buf[start_idx] &= ~left
+        buf[end_idx] &= ~right
+        run = end_idx - start_idx - 1
+        if run > 0:
+            buf[start_idx + 1:end_idx] = _WHITE_ROW[:run]
+
+    def invert_span(self, y: int, x_start: int, x_end: int) -> None:
+        """
+        Invert pixels in a horizontal span (black <-> white).
+
+        Same clipping rules as fill_span: x_start inclusive, x_end
+        exclusive, out-of-range rows are a no-op. Edge bytes are flipped
+        with XOR masks and the full-byte run with one bytes.translate call.
+
+        Args:
+            y: Y coordinate (0-299)
+            x_start: Starting X coordinate (inclusive)
+            x_end: Ending X coordinate (exclusive)
+        """
+        # Bounds check on y
+        if not 0 <= y < self.HEIGHT:
+            return
+
+        # Clamp x coordinates to valid range
+        if x_start < 0:
+            x_start = 0
+        if x_end > self.WIDTH:
+            x_end = self.WIDTH
+
+        # Empty or invalid span
+        if x_start >= x_end:
+            return
+
+        buf = self.buffer
+        row_offset = y * self.BYTES_PER_ROW
+
+        # Byte indices of the first and last pixel in the span
+        start_idx = row_offset + (x_start >> 3)
+        end_idx = row_offset + ((x_end - 1) >> 3)
+
+        left = _LEFT_MASK[x_start & 7]
+        right = _RIGHT_MASK[(x_end - 1) & 7]
+
+        if start_idx == end_idx:
+            # All pixels are in the same byte
+            buf[start_idx] ^= left & right
+            return
+
+        buf[start_idx] ^= left
+        buf[end_idx] ^= right
+        if end_idx - start_idx > 1:
+            buf[start_idx + 1:end_idx] = buf[start_idx + 1:end_idx].translate(_INVERT)
@@ -14,10 +14,14 @@ Pattern levels:
 Patterns tile from global (0,0) origin for consistent rendering.
 """
 
+from typing import Optional
+
 try:
-    from .framebuffer import Framebuffer
+    from .framebuffer import Framebuffer, _LEFT_MASK, _RIGHT_MASK
+    from .primitives import _as_point_list, _polygon_spans
 except ImportError:
-    from framebuffer import Framebuffer
+    from framebuffer import Framebuffer, _LEFT_MASK, _RIGHT_MASK
+    from primitives import _as_point_list, _polygon_spans
 
 
 # 4x4 Bayer matrix for ordered dithering
@@ -50,12 +54,56 @@ _PATTERN_THRESHOLDS = {
 }
 
 
+def _build_pattern_mask(threshold: int) -> int:
+    """
+    Pack the 4x4 Bayer tile for a threshold into a 16-bit mask.
+
+    Bit (y * 4 + x) is set iff BAYER_4X4[y][x] < threshold.
+    """
+    mask = 0
+    for by in range(4):
+        for bx in range(4):
+            if BAYER_4X4[by][bx] < threshold:
+                mask |= 1 << ((by << 2) | bx)
+    return mask
+
+
+# Packed Bayer tile per pattern level, built once at import
+_PATTERN_MASKS = {
+    pattern: _build_pattern_mask(threshold)
+    for pattern, threshold in _PATTERN_THRESHOLDS.items()
+}
+
+
+def _build_row_strip(pattern_mask: int, row: int) -> bytes:
+    """
+    Pack one framebuffer row of a pattern into BYTES_PER_ROW bytes.
+
+    The tile repeats every 4 pixels, so every byte in the row is the same.
+    """
+    row_bits = (pattern_mask >> (row << 2)) & 0xF
+    byte = 0
+    for x in range(8):
+        if (row_bits >> (x & 3)) & 1:
+            byte |= 0x80 >> x
+    return bytes([byte]) * Framebuffer.BYTES_PER_ROW
+
+
+# Full-row pattern bytes per pattern level, indexed by y & 3
+_ROW_STRIPS = {
+    pattern: [_build_row_strip(mask, row) for row in range(4)]
+    for pattern, mask in _PATTERN_MASKS.items()
+}
+
+
 def pattern_test(pattern: int, x: int, y: int) -> bool:
     """
     Test if a pixel should be filled (black) for a given pattern.
 
     Uses the Bayer 4x4 matrix to determine if the pixel at global
     coordinates (x, y) should be filled based on the pattern threshold.
+    The tile is pre-packed into a 16-bit mask, so the test is a single
+    shift-and-mask.
 
     Args:
         pattern: Pattern level (Pattern.SOLID_BLACK to Pattern.SOLID_WHITE)
@@ -65,19 +113,9 @@ def pattern_test(pattern: int, x: int, y: int) -> bool:
     Returns:
         True if the pixel should be filled (black), False otherwise (white)
     """
-    threshold = _PATTERN_THRESHOLDS.get(pattern, 0)
-
-    # Handle edge cases
-    if threshold <= 0:
-        return False
-    if threshold >= 16:
-        return True
-
-    # Get the Bayer matrix value for this position
-    # Use modulo to tile the pattern from global (0, 0)
-    bayer_value = BAYER_4X4[y & 3][x & 3]
-
-    return bayer_value < threshold
+    # Unknown patterns fill nothing; & 3 tiles the pattern from global (0, 0)
+    mask = _PATTERN_MASKS.get(pattern, 0)
+    return bool((mask >> (((y & 3) << 2) | (x & 3))) & 1)
 
 
 def fill_polygon_pattern(
@@ -87,8 +125,9 @@ def fill_polygon_pattern(
     Fill a polygon using the scanline fill algorithm with pattern mask.
 
     This function is similar to fill_polygon from primitives, but applies
-    a dither pattern instead of a solid fill. Each pixel is tested against
-    the pattern to determine if it should be filled.
+    a dither pattern instead of a solid fill. Each span is ORed with a
+    precomputed row of pattern bytes, so only black pattern pixels are set
+    and existing pixels are left untouched.
 
     Patterns tile from global (0,0) origin for consistent alignment
     across multiple shapes.
@@ -97,9 +136,11 @@ def fill_polygon_pattern(
 
     Args:
         fb: Framebuffer to draw on
-        points: List of (x, y) coordinate tuples defining the polygon vertices
+        points: List of (x, y) coordinate tuples defining the polygon vertices,
+            or an (N, 2) integer array
         pattern: Pattern level (Pattern.SOLID_BLACK to Pattern.SOLID_WHITE)
     """
+    points = _as_point_list(points)
     if len(points) < 3:
         return
 
@@ -107,50 +148,125 @@ def fill_polygon_pattern(
     if pattern == Pattern.SOLID_WHITE:
         return
 
-    # Find bounding box
-    min_y = min(p[1] for p in points)
-    max_y = max(p[1] for p in points)
-
-    # Clamp to framebuffer bounds
-    min_y = max(0, min_y)
-    max_y = min(fb.HEIGHT - 1, max_y)
-
-    n = len(points)
-
-    # Scanline fill
-    for y in range(min_y, max_y + 1):
-        # Find all intersections with this scanline
-        intersections = []
-
-        for i in range(n):
-            x0, y0 = points[i]
-            x1, y1 = points[(i + 1) % n]
-
-            # Skip horizontal edges
-            if y0 == y1:
-                continue
-
-            # Ensure y0 < y1 for consistent processing
-            if y0 > y1:
-                x0, y0, x1, y1 = x1, y1, x0, y0
-
-            # Check if scanline intersects this edge
-            # Use y0 <= y < y1 to handle vertices correctly (avoid double counting)
-            if y0 <= y < y1:
-                # Calculate x intersection using integer math
-                # x = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
-                x_intersect = x0 + (y - y0) * (x1 - x0) // (y1 - y0)
-                intersections.append(x_intersect)
-
-        # Sort intersections
-        intersections.sort()
-
-        # Fill between pairs of intersections (even-odd rule)
-        for i in range(0, len(intersections) - 1, 2):
-            x_start = intersections[i]
-            x_end = intersections[i + 1]
-
-            # Apply pattern to each pixel in the span
-            for x in range(x_start, x_end + 1):
-                if pattern_test(pattern, x, y):
-                    fb.set_pixel(x, y, True)
+    strips = _ROW_STRIPS.get(pattern)
+    if strips is None:
+        return
+
+    # Axis-aligned rectangles skip the generic scanline walk
+    rect = _axis_aligned_rect(points)
+    if rect is not None:
+        fill_rect_pattern(fb, *rect, pattern)
+        return
+
+    # Hoist attribute lookups out of the span loop
+    buf = fb.buffer
+    bytes_per_row = fb.BYTES_PER_ROW
+    max_x = fb.WIDTH - 1
+
+    for y, x_start, x_end in _polygon_spans(points, fb.HEIGHT):
+        # Span is inclusive of both ends; clip to the row
+        if x_start < 0:
+            x_start = 0
+        if x_end > max_x:
+            x_end = max_x
+        if x_start <= x_end:
+            _or_pattern_span(buf, y * bytes_per_row, strips[y & 3],
+                             x_start, x_end)
+
+
+def fill_rect_pattern(
+    fb: Framebuffer, x: int, y: int, w: int, h: int, pattern: int
+) -> None:
+    """
+    Fill an axis-aligned rectangle with a dither pattern.
+
+    Equivalent to fill_polygon_pattern on the rectangle's outline, but the
+    clipped byte range and edge masks are computed once and each row is a
+    single strip OR.
+
+    Args:
+        fb: Framebuffer to draw on
+        x: Left edge X coordinate
+        y: Top edge Y coordinate
+        w: Width in pixels
+        h: Height in pixels
+        pattern: Pattern level (Pattern.SOLID_BLACK to Pattern.SOLID_WHITE)
+    """
+    if w <= 0 or h <= 0:
+        return
+
+    strips = _ROW_STRIPS.get(pattern)
+    if strips is None or pattern == Pattern.SOLID_WHITE:
+        return
+
+    # Clip to framebuffer bounds (x_end inclusive, y_end exclusive)
+    x_start = max(x, 0)
+    x_end = min(x + w - 1, fb.WIDTH - 1)
+    y_start = max(y, 0)
+    y_end = min(y + h, fb.HEIGHT)
+    if x_start > x_end or y_start >= y_end:
+        return
+
+    buf = fb.buffer
+    bytes_per_row = fb.BYTES_PER_ROW
+    for row in range(y_start, y_end):
+        _or_pattern_span(buf, row * bytes_per_row, strips[row & 3],
+                         x_start, x_end)
+
+
+def _axis_aligned_rect(
+    points: list[tuple[int, int]]
+) -> Optional[tuple[int, int, int, int]]:
+    """
+    Return (x, y, w, h) if points outline an axis-aligned rectangle.
+
+    The result covers exactly the pixels the scanline fill would: every
+    column from left to right inclusive, and rows top..bottom-1.
+    """
+    # Four distinct corners (a repeated vertex makes a degenerate sliver)
+    if len(points) != 4 or len({tuple(p) for p in points}) != 4:
+        return None
+
+    xs = {p[0] for p in points}
+    ys = {p[1] for p in points}
+    if len(xs) != 2 or len(ys) != 2:
+        return None
+
+    # Every edge must be horizontal or vertical (rules out bowties)
+    for i in range(4):
+        x0, y0 = points[i]
+        x1, y1 = points[(i + 1) % 4]
+        if x0 != x1 and y0 != y1:
+            return None
+
+    left, right = min(xs), max(xs)
+    top, bottom = min(ys), max(ys)
+    return left, top, right - left + 1, bottom - top
+
+
+def _or_pattern_span(buf: bytearray, row_offset: int, strip: bytes,
+                     x_start: int, x_end: int) -> None:
+    """
+    OR a pattern strip into one clipped, inclusive span of a row.
+
+    Edge bytes are masked with the shared framebuffer edge masks; the
+    full bytes in between are merged with a single big-int OR.
+    """
+    start_byte = x_start >> 3
+    end_byte = x_end >> 3
+    if start_byte == end_byte:
+        mask = _LEFT_MASK[x_start & 7] & _RIGHT_MASK[x_end & 7]
+        buf[row_offset + start_byte] |= strip[start_byte] & mask
+        return
+
+    buf[row_offset + start_byte] |= strip[start_byte] & _LEFT_MASK[x_start & 7]
+    buf[row_offset + end_byte] |= strip[end_byte] & _RIGHT_MASK[x_end & 7]
+
+    # Full bytes in between: one big-int OR for the whole run
+    run = end_byte - start_byte - 1
+    if run > 0:
+        lo = row_offset + start_byte + 1
+        hi = lo + run
+        merged = (int.from_bytes(buf[lo:hi], "big")
+                  | int.from_bytes(strip[start_byte + 1:end_byte], "big"))
+        buf[lo:hi] = merged.to_bytes(run, "big")
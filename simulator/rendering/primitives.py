@@ -12,9 +12,15 @@ Algorithms used:
 """
 
 try:
-    from .framebuffer import Framebuffer
+    from .framebuffer import (
+        Framebuffer, _PIXEL_MASK, _LEFT_MASK, _RIGHT_MASK,
+        _BLACK_ROW, _WHITE_ROW, _ALL_BLACK, _ALL_WHITE,
+    )
 except ImportError:
-    from framebuffer import Framebuffer
+    from framebuffer import (
+        Framebuffer, _PIXEL_MASK, _LEFT_MASK, _RIGHT_MASK,
+        _BLACK_ROW, _WHITE_ROW, _ALL_BLACK, _ALL_WHITE,
+    )
 
 
 def draw_line(fb: Framebuffer, x0: int, y0: int, x1: int, y1: int, color: bool) -> None:
@@ -31,6 +37,13 @@ def draw_line(fb: Framebuffer, x0: int, y0: int, x1: int, y1: int, color: bool)
         y1: Ending Y coordinate
         color: True for black, False for white
     """
+    # Horizontal lines are a single span
+    if y0 == y1:
+        if x0 > x1:
+            x0, x1 = x1, x0
+        fb.fill_span(y0, x0, x1 + 1, color)
+        return
+
     # Calculate deltas
     dx = abs(x1 - x0)
     dy = abs(y1 - y0)
@@ -44,8 +57,36 @@ def draw_line(fb: Framebuffer, x0: int, y0: int, x1: int, y1: int, color: bool)
 
     x, y = x0, y0
 
+    # Write bytes directly instead of calling set_pixel per pixel
+    buf = fb.buffer
+    width = fb.WIDTH
+    height = fb.HEIGHT
+    bytes_per_row = fb.BYTES_PER_ROW
+
+    # A line is convex, so if both endpoints are on screen every pixel is;
+    # skip the per-pixel bounds check in that (common) case.
+    if (0 <= x0 < width and 0 <= y0 < height
+            and 0 <= x1 < width and 0 <= y1 < height):
+        if color:
+            while True:
+                buf[y * bytes_per_row + (x >> 3)] |= _PIXEL_MASK[x & 7]
+                if x == x1 and y == y1:
+                    break
+                e2 = 2 * err
+                if e2 > -dy:
+                    err -= dy
+                    x += sx
+                if e2 < dx:
+                    err += dx
+                    y += sy
+            return
+
     while True:
-        fb.set_pixel(x, y, color)
+        if 0 <= x < width and 0 <= y < height:
+            if color:
+                buf[y * bytes_per_row + (x >> 3)] |= _PIXEL_MASK[x & 7]
+            else:
+                buf[y * bytes_per_row + (x >> 3)] &= ~_PIXEL_MASK[x & 7]
 
         # Check if we've reached the endpoint
         if x == x1 and y == y1:
@@ -62,6 +103,18 @@ def draw_line(fb: Framebuffer, x0: int, y0: int, x1: int, y1: int, color: bool)
             y += sy
 
 
+def _as_point_list(points):
+    """
+    Return polygon vertices as plain Python ints.
+
+    NumPy (N, 2) arrays are accepted, but their scalar elements make every
+    per-scanline operation several times slower, so they are converted
+    once with tolist(). Lists and tuples are returned unchanged.
+    """
+    tolist = getattr(points, "tolist", None)
+    return tolist() if tolist is not None else points
+
+
 def draw_polygon(fb: Framebuffer, points: list[tuple[int, int]], color: bool) -> None:
     """
     Draw a polygon outline as connected line segments.
@@ -71,9 +124,11 @@ def draw_polygon(fb: Framebuffer, points: list[tuple[int, int]], color: bool) ->
 
     Args:
         fb: Framebuffer to draw on
-        points: List of (x, y) coordinate tuples defining the polygon vertices
+        points: List of (x, y) coordinate tuples defining the polygon vertices,
+            or an (N, 2) integer array
         color: True for black, False for white
     """
+    points = _as_point_list(points)
     if len(points) < 2:
         return
 
@@ -84,20 +139,23 @@ def draw_polygon(fb: Framebuffer, points: list[tuple[int, int]], color: bool) ->
         draw_line(fb, x0, y0, x1, y1, color)
 
 
-def fill_polygon(fb: Framebuffer, points: list[tuple[int, int]], color: bool) -> None:
+def _polygon_spans(points: list[tuple[int, int]], height: int):
     """
-    Fill a polygon using the scanline fill algorithm.
-
-    Handles convex and simple concave polygons. For self-intersecting
-    polygons, the result may be unpredictable.
+    Yield the horizontal spans covered by a polygon, one scanline at a time.
 
-    Uses the even-odd rule for determining inside/outside.
+    Shared by fill_polygon and patterns.fill_polygon_pattern so both use
+    the same scanline rules. Uses the even-odd rule; the bottom-most row
+    of each edge is excluded (y0 <= y < y1) to avoid double counting.
 
     Args:
-        fb: Framebuffer to draw on
-        points: List of (x, y) coordinate tuples defining the polygon vertices
-        color: True for black, False for white
+        points: List of (x, y) coordinate tuples defining the polygon vertices,
+            or an (N, 2) integer array
+        height: Framebuffer height; scanlines are clamped to 0..height-1
+
+    Yields:
+        (y, x_start, x_end) with x_end inclusive and x not clipped
     """
+    points = _as_point_list(points)
     if len(points) < 3:
         return
 
@@ -107,51 +165,93 @@ def fill_polygon(fb: Framebuffer, points: list[tuple[int, int]], color: bool) ->
 
     # Clamp to framebuffer bounds
     min_y = max(0, min_y)
-    max_y = min(fb.HEIGHT - 1, max_y)
+    max_y = min(height - 1, max_y)
 
+    # Build the edge table once: horizontal edges are dropped and each
+    # edge is stored top-to-bottom as (y0, y1, x0, dx, dy)
+    edges = []
     n = len(points)
+    for i in range(n):
+        x0, y0 = points[i]
+        x1, y1 = points[(i + 1) % n]
 
-    # Scanline fill
-    for y in range(min_y, max_y + 1):
-        # Find all intersections with this scanline
-        intersections = []
+        # Skip horizontal edges
+        if y0 == y1:
+            continue
 
-        for i in range(n):
-            x0, y0 = points[i]
-            x1, y1 = points[(i + 1) % n]
+        # Ensure y0 < y1 for consistent processing
+        if y0 > y1:
+            x0, y0, x1, y1 = x1, y1, x0, y0
 
-            # Skip horizontal edges
-            if y0 == y1:
-                continue
+        edges.append((y0, y1, x0, x1 - x0, y1 - y0))
 
-            # Ensure y0 < y1 for consistent processing
-            if y0 > y1:
-                x0, y0, x1, y1 = x1, y1, x0, y0
+    # Sort by top y so edges enter the active edge table in order
+    edges.sort()
+    num_edges = len(edges)
+    next_edge = 0
+    active = []
+    retire_y = max_y + 1  # First scanline at which an active edge ends
 
-            # Check if scanline intersects this edge
-            # Use y0 <= y < y1 to handle vertices correctly (avoid double counting)
-            if y0 <= y < y1:
-                # Calculate x intersection using integer math
-                # x = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
-                x_intersect = x0 + (y - y0) * (x1 - x0) // (y1 - y0)
-                intersections.append(x_intersect)
+    # Scanline fill
+    for y in range(min_y, max_y + 1):
+        # Activate edges starting on or above this scanline, and retire
+        # edges that ended (y0 <= y < y1 avoids double counting vertices)
+        added = False
+        while next_edge < num_edges and edges[next_edge][0] <= y:
+            active.append(edges[next_edge])
+            next_edge += 1
+            added = True
+        if added or y >= retire_y:
+            active = [e for e in active if e[1] > y]
+            retire_y = min((e[1] for e in active), default=max_y + 1)
+
+        # Every active edge satisfies y0 <= y < y1, so intersections are
+        # accumulated unconditionally with no per-edge crossing test.
+        # x = x0 + (y - y0) * (x1 - x0) / (y1 - y0), in integer math
+        intersections = [
+            x0 + (y - y0) * dx // dy
+            for y0, _, x0, dx, dy in active
+        ]
 
         # Sort intersections
         intersections.sort()
 
-        # Fill between pairs of intersections (even-odd rule)
+        # Pair up intersections (even-odd rule)
         for i in range(0, len(intersections) - 1, 2):
-            x_start = intersections[i]
-            x_end = intersections[i + 1]
-            # fill_span uses exclusive end
-            fb.fill_span(y, x_start, x_end + 1, color)
+            yield y, intersections[i], intersections[i + 1]
+
+
+def fill_polygon(fb: Framebuffer, points: list[tuple[int, int]], color: bool) -> None:
+    """
+    Fill a polygon using the scanline fill algorithm.
+
+    Handles convex and simple concave polygons. For self-intersecting
+    polygons, the result may be unpredictable.
+
+    Uses the even-odd rule for determining inside/outside.
+
+    Args:
+        fb: Framebuffer to draw on
+        points: List of (x, y) coordinate tuples defining the polygon vertices,
+            or an (N, 2) integer array
+        color: True for black, False for white
+    """
+    # Bind the color-specialized span writer once for all scanlines
+    fill_span = fb._fill_span_set if color else fb._fill_span_clear
+
+    for y, x_start, x_end in _polygon_spans(points, fb.HEIGHT):
+        # fill_span uses exclusive end
+        fill_span(y, x_start, x_end + 1)
 
 
 def fill_rect(fb: Framebuffer, x: int, y: int, w: int, h: int, color: bool) -> None:
     """
     Fill an axis-aligned rectangle.
 
-    Uses fill_span for efficient horizontal fills.
+    Same result as one fill_span per row, but clipping, byte indices and
+    edge masks are computed once for the whole rectangle. Full-width
+    rectangles are contiguous in memory and become a single slice
+    assignment.
 
     Args:
         fb: Framebuffer to draw on
@@ -164,10 +264,61 @@ def fill_rect(fb: Framebuffer, x: int, y: int, w: int, h: int, color: bool) -> N
     if w <= 0 or h <= 0:
         return
 
-    x_end = x + w
+    # Clip to framebuffer bounds (x_end inclusive, y_end exclusive)
+    x_start = max(x, 0)
+    x_end = min(x + w - 1, fb.WIDTH - 1)
+    y_start = max(y, 0)
+    y_end = min(y + h, fb.HEIGHT)
+    if x_start > x_end or y_start >= y_end:
+        return
 
-    for row in range(y, y + h):
-        fb.fill_span(row, x, x_end, color)
+    buf = fb.buffer
+    bytes_per_row = fb.BYTES_PER_ROW
+    first = y_start * bytes_per_row
+    stop = y_end * bytes_per_row
+
+    # Full-width rows: one memcpy from the cached whole-buffer constant
+    if x_start == 0 and x_end == fb.WIDTH - 1:
+        buf[first:stop] = memoryview(_ALL_BLACK if color else _ALL_WHITE)[:stop - first]
+        return
+
+    start_byte = x_start >> 3
+    end_byte = x_end >> 3
+    left = _LEFT_MASK[x_start & 7]
+    right = _RIGHT_MASK[x_end & 7]
+
+    if start_byte == end_byte:
+        # Every row touches a single byte
+        mask = left & right
+        if color:
+            for idx in range(first + start_byte, stop, bytes_per_row):
+                buf[idx] |= mask
+        else:
+            mask ^= 0xFF
+            for idx in range(first + start_byte, stop, bytes_per_row):
+                buf[idx] &= mask
+        return
+
+    # Full bytes between the two edge bytes, written as a slice per row
+    run = end_byte - start_byte - 1
+    fill = (_BLACK_ROW if color else _WHITE_ROW)[:run]
+
+    if color:
+        for row_offset in range(first, stop, bytes_per_row):
+            start_idx = row_offset + start_byte
+            end_idx = row_offset + end_byte
+            buf[start_idx] |= left
+            buf[end_idx] |= right
+            buf[start_idx + 1:end_idx] = fill
+    else:
+        left ^= 0xFF
+        right ^= 0xFF
+        for row_offset in range(first, stop, bytes_per_row):
+            start_idx = row_offset + start_byte
+            end_idx = row_offset + end_byte
+            buf[start_idx] &= left
+            buf[end_idx] &= right
+            buf[start_idx + 1:end_idx] = fill
 
 
 def draw_circle(fb: Framebuffer, cx: int, cy: int, r: int, color: bool) -> None:
@@ -188,6 +339,12 @@ def draw_circle(fb: Framebuffer, cx: int, cy: int, r: int, color: bool) -> None:
         fb.set_pixel(cx, cy, color)
         return
 
+    # Fully on-screen black outlines skip clipping and write bytes directly
+    if (color and 0 <= cx - r and cx + r < fb.WIDTH
+            and 0 <= cy - r and cy + r < fb.HEIGHT):
+        _draw_circle_unclipped(fb.buffer, fb.BYTES_PER_ROW, cx, cy, r)
+        return
+
     # Midpoint circle algorithm
     x = r
     y = 0
@@ -215,6 +372,54 @@ def draw_circle(fb: Framebuffer, cx: int, cy: int, r: int, color: bool) -> None:
             d += 2 * y - 2 * x + 1
 
 
+def _draw_circle_unclipped(buf: bytearray, bytes_per_row: int, cx: int, cy: int, r: int) -> None:
+    """
+    Set the pixels of a circle outline that lies entirely on screen.
+
+    Same midpoint walk as draw_circle, but each of the 8 symmetric points
+    is ORed straight into the buffer with no bounds checks.
+    """
+    x = r
+    y = 0
+    d = 1 - r
+
+    while x >= y:
+        # Row offsets and column byte/mask pairs shared by the 8 points
+        row_py = (cy + y) * bytes_per_row
+        row_my = (cy - y) * bytes_per_row
+        row_px = (cy + x) * bytes_per_row
+        row_mx = (cy - x) * bytes_per_row
+        col_px = cx + x
+        col_mx = cx - x
+        col_py = cx + y
+        col_my = cx - y
+        mask_px = _PIXEL_MASK[col_px & 7]
+        mask_mx = _PIXEL_MASK[col_mx & 7]
+        mask_py = _PIXEL_MASK[col_py & 7]
+        mask_my = _PIXEL_MASK[col_my & 7]
+        col_px >>= 3
+        col_mx >>= 3
+        col_py >>= 3
+        col_my >>= 3
+
+        buf[row_py + col_px] |= mask_px
+        buf[row_py + col_mx] |= mask_mx
+        buf[row_my + col_px] |= mask_px
+        buf[row_my + col_mx] |= mask_mx
+        buf[row_px + col_py] |= mask_py
+        buf[row_px + col_my] |= mask_my
+        buf[row_mx + col_py] |= mask_py
+        buf[row_mx + col_my] |= mask_my
+
+        y += 1
+
+        if d <= 0:
+            d += 2 * y + 1
+        else:
+            x -= 1
+            d += 2 * y - 2 * x + 1
+
+
 def fill_circle(fb: Framebuffer, cx: int, cy: int, r: int, color: bool) -> None:
     """
     Fill a circle using horizontal spans.
@@ -240,19 +445,24 @@ def fill_circle(fb: Framebuffer, cx: int, cy: int, r: int, color: bool) -> None:
     x = r
     y = 0
     d = 1 - r
+    fill_span = fb._fill_span_set if color else fb._fill_span_clear
 
     while x >= y:
         # Fill horizontal spans for all 4 quadrants
         # Top and bottom spans (using y offset for x span width)
-        fb.fill_span(cy + y, cx - x, cx + x + 1, color)
-        fb.fill_span(cy - y, cx - x, cx + x + 1, color)
-
-        # Middle spans (using x offset for y position)
-        fb.fill_span(cy + x, cx - y, cx + y + 1, color)
-        fb.fill_span(cy - x, cx - y, cx + y + 1, color)
+        fill_span(cy + y, cx - x, cx + x + 1)
+        if y:
+            fill_span(cy - y, cx - x, cx + x + 1)
 
         y += 1
 
+        # Middle spans (using x offset for y position). Rows cy +/- x only
+        # widen while x is unchanged, so fill each once at its final width:
+        # just before x steps, or when the loop is about to end
+        if d > 0 or x < y:
+            fill_span(cy + x, cx - y + 1, cx + y)
+            fill_span(cy - x, cx - y + 1, cx + y)
+
         if d <= 0:
             d += 2 * y + 1
         else:
@@ -24,6 +24,7 @@ from rendering.bezier import (
     _bezier_flatness,
 )
 from rendering.framebuffer import Framebuffer
+from rendering._testing import count_pixels
 
 
 class TestAutoTangent:
@@ -450,14 +451,8 @@ class TestStrokeBezierTextureBall:
         stroke_bezier_texture_ball(fb_dense, points, 0.5, texture, spacing=2.0)
 
         # Count pixels
-        sparse_count = sum(
-            1 for y in range(fb_sparse.HEIGHT) for x in range(fb_sparse.WIDTH)
-            if fb_sparse.get_pixel(x, y)
-        )
-        dense_count = sum(
-            1 for y in range(fb_dense.HEIGHT) for x in range(fb_dense.WIDTH)
-            if fb_dense.get_pixel(x, y)
-        )
+        sparse_count = count_pixels(fb_sparse)
+        dense_count = count_pixels(fb_dense)
 
         assert dense_count >= sparse_count
 
@@ -480,9 +475,7 @@ class TestStrokeBezierTextureBall:
         )
 
         # Should have drawn something
-        pixel_count = sum(
-            1 for y in range(fb.HEIGHT) for x in range(fb.WIDTH) if fb.get_pixel(x, y)
-        )
+        pixel_count = count_pixels(fb)
         assert pixel_count > 0
 
 
@@ -498,9 +491,7 @@ class TestDrawBezierCurve:
         )
 
         # Should have pixels
-        pixel_count = sum(
-            1 for y in range(fb.HEIGHT) for x in range(fb.WIDTH) if fb.get_pixel(x, y)
-        )
+        pixel_count = count_pixels(fb)
         assert pixel_count > 0
 
     def test_color_parameter(self):
@@ -513,10 +504,7 @@ class TestDrawBezierCurve:
         )
 
         # Should have white pixels (curve erases black)
-        white_count = sum(
-            1 for y in range(fb.HEIGHT) for x in range(fb.WIDTH)
-            if not fb.get_pixel(x, y)
-        )
+        white_count = fb.WIDTH * fb.HEIGHT - count_pixels(fb)
         assert white_count > 0
 
     def test_single_point_draws_pixel(self):
@@ -581,9 +569,7 @@ class TestIntegration:
         stroke_bezier_texture_ball(fb, points, 0.7, DEFAULT_BALL_8X8, spacing=3.0)
 
         # Should form a continuous closed shape
-        pixel_count = sum(
-            1 for y in range(fb.HEIGHT) for x in range(fb.WIDTH) if fb.get_pixel(x, y)
-        )
+        pixel_count = count_pixels(fb)
         assert pixel_count > 500  # Substantial number of pixels
 
     def test_auto_tangent_creates_smooth_handles(self):
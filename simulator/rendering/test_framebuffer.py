@@ -5,11 +5,17 @@ These tests verify:
 - Basic buffer properties
 - Pixel set/get operations
 - Bit ordering (bit 7 = leftmost)
+- is_empty
+- get_row_bytes
 - Bounds checking
 - fill_span optimization and edge cases
+- invert_span
 """
 
 import unittest
+
+import numpy as np
+
 from rendering.framebuffer import Framebuffer
 
 
@@ -57,6 +63,55 @@ class TestClear(unittest.TestCase):
         self.assertTrue(all(b == 0 for b in fb.buffer))
 
 
+class TestIsEmpty(unittest.TestCase):
+    """Test the is_empty() method."""
+
+    def test_new_buffer_is_empty(self):
+        """A fresh framebuffer has no pixels set."""
+        self.assertTrue(Framebuffer().is_empty())
+
+    def test_single_pixel_not_empty(self):
+        """Any set pixel, including the last one, makes the buffer non-empty."""
+        fb = Framebuffer()
+        fb.set_pixel(399, 299, True)
+        self.assertFalse(fb.is_empty())
+        fb.set_pixel(399, 299, False)
+        self.assertTrue(fb.is_empty())
+
+    def test_black_buffer_not_empty(self):
+        """clear(True) leaves the buffer non-empty."""
+        fb = Framebuffer()
+        fb.clear(True)
+        self.assertFalse(fb.is_empty())
+
+
+class TestGetRowBytes(unittest.TestCase):
+    """Test the get_row_bytes() method."""
+
+    def test_covering_bytes(self):
+        """Partial edge bytes include their neighbours (MSB = leftmost)."""
+        fb = Framebuffer()
+        fb.fill_span(10, 10, 51, True)
+        self.assertEqual(fb.get_row_bytes(10, 10, 51), b"\x3f" + b"\xff" * 4 + b"\xe0")
+
+    def test_byte_aligned_run(self):
+        """A byte-aligned run returns exactly its own bytes."""
+        fb = Framebuffer()
+        fb.fill_span(3, 16, 40, True)
+        self.assertEqual(fb.get_row_bytes(3, 16, 40), b"\xff" * 3)
+        self.assertEqual(fb.get_row_bytes(4, 16, 40), bytes(3))
+
+    def test_clipping(self):
+        """Runs are clipped to the row; out-of-range rows return b''."""
+        fb = Framebuffer()
+        fb.clear(True)
+        self.assertEqual(fb.get_row_bytes(0, -20, 5), b"\xff")
+        self.assertEqual(fb.get_row_bytes(0, 395, 500), b"\xff")
+        self.assertEqual(fb.get_row_bytes(-1, 0, 400), b"")
+        self.assertEqual(fb.get_row_bytes(300, 0, 400), b"")
+        self.assertEqual(fb.get_row_bytes(0, 50, 50), b"")
+
+
 class TestPixelOperations(unittest.TestCase):
     """Test set_pixel and get_pixel methods."""
 
@@ -288,6 +343,15 @@ class TestFillSpan(unittest.TestCase):
             self.assertEqual(fb.buffer[i], 0xFF)
         self.assertEqual(fb.buffer[50], 0x00)
 
+    def test_fill_span_full_row_clear(self):
+        """Clearing a full (over-clipped) row should leave neighbours intact."""
+        fb = Framebuffer()
+        fb.clear(True)
+        fb.fill_span(1, -10, 410, False)
+        self.assertEqual(fb.buffer[50:100], bytes(50))
+        self.assertEqual(fb.buffer[49], 0xFF)
+        self.assertEqual(fb.buffer[100], 0xFF)
+
     def test_fill_span_row_offset(self):
         """fill_span on row 1 should affect bytes 50+."""
         fb = Framebuffer()
@@ -338,11 +402,86 @@ class TestFillSpanConsistency(unittest.TestCase):
                     for x in range(x_start, x_end):
                         fb_pixel.set_pixel(x, y, True)
 
-                    self.assertEqual(
-                        fb_span.buffer, fb_pixel.buffer,
+                    a = np.frombuffer(fb_span.buffer, np.uint8)
+                    b = np.frombuffer(fb_pixel.buffer, np.uint8)
+                    self.assertTrue(
+                        np.array_equal(a, b),
                         f"Mismatch for span y={y}, x={x_start}:{x_end}"
                     )
 
+    def test_fill_span_clear_matches_set_pixel(self):
+        """fill_span(color=False) should match a set_pixel(False) loop."""
+        for x_start in range(0, 20, 3):
+            for x_end in range(x_start, 30, 5):
+                fb_span = Framebuffer()
+                fb_pixel = Framebuffer()
+                fb_span.clear(True)
+                fb_pixel.clear(True)
+
+                fb_span.fill_span(7, x_start, x_end, False)
+                for x in range(x_start, x_end):
+                    fb_pixel.set_pixel(x, 7, False)
+
+                self.assertEqual(
+                    fb_span.buffer, fb_pixel.buffer,
+                    f"Mismatch for cleared span x={x_start}:{x_end}"
+                )
+
+    def test_fill_span_matches_packed_reference(self):
+        """fill_span should match a NumPy-packed reference for every span."""
+        pixels = np.zeros((Framebuffer.HEIGHT, Framebuffer.WIDTH), np.uint8)
+        fb = Framebuffer()
+        for x_start in range(0, 20, 3):
+            for x_end in range(x_start, 30, 5):
+                for y in [0, 1, 150, 299]:
+                    fb.clear()
+                    pixels[y, x_start:x_end] = 1
+
+                    fb.fill_span(y, x_start, x_end, True)
+                    expected = np.packbits(pixels, axis=1).ravel()
+
+                    self.assertTrue(
+                        np.array_equal(np.frombuffer(fb.buffer, np.uint8), expected),
+                        f"Mismatch for span y={y}, x={x_start}:{x_end}"
+                    )
+                    pixels[y] = 0
+
+
+class TestInvertSpan(unittest.TestCase):
+    """Test invert_span method."""
+
+    def test_invert_span_matches_per_pixel(self):
+        """invert_span should flip exactly the pixels in [x_start, x_end)."""
+        for x_start, x_end in [(0, 400), (3, 5), (6, 10), (5, 381), (-8, 13)]:
+            fb = Framebuffer()
+            # Mixed background so both colors get flipped
+            fb.fill_span(4, 0, 200, True)
+            expected = [not fb.get_pixel(x, 4) if x_start <= x < x_end
+                        else fb.get_pixel(x, 4) for x in range(400)]
+
+            fb.invert_span(4, x_start, x_end)
+
+            actual = [fb.get_pixel(x, 4) for x in range(400)]
+            self.assertEqual(actual, expected,
+                             f"Mismatch for invert span {x_start}:{x_end}")
+
+    def test_invert_span_twice_restores(self):
+        """Inverting the same span twice should be a no-op."""
+        fb = Framebuffer()
+        fb.fill_span(10, 17, 93, True)
+        before = bytes(fb.buffer)
+        fb.invert_span(10, 5, 301)
+        fb.invert_span(10, 5, 301)
+        self.assertEqual(fb.buffer, before)
+
+    def test_invert_span_out_of_bounds(self):
+        """Out-of-range rows and empty spans should do nothing."""
+        fb = Framebuffer()
+        fb.invert_span(-1, 0, 400)
+        fb.invert_span(300, 0, 400)
+        fb.invert_span(5, 10, 10)
+        self.assertTrue(all(b == 0 for b in fb.buffer))
+
 
 class TestLastByte(unittest.TestCase):
     """Test operations on the last byte of rows (byte 49)."""
@@ -9,16 +9,35 @@ These tests verify:
 - Pattern tiling from global (0,0)
 """
 
+import re
 import unittest
+from pathlib import Path
+
+import numpy as np
+
 from rendering.framebuffer import Framebuffer
+from rendering._testing import count_set_bits
 from rendering.patterns import (
     BAYER_4X4,
     Pattern,
     pattern_test,
     fill_polygon_pattern,
+    fill_rect_pattern,
+    _PATTERN_MASKS,
 )
 
 
+# Firmware rendering component, checked against the simulator's tables
+_FIRMWARE_DIR = (Path(__file__).resolve().parents[2]
+                 / "esp32_rendering" / "components" / "rendering")
+
+
+def _int_list(pattern, source):
+    """Integers inside the first brace initializer matched by pattern."""
+    match = re.search(pattern, source, re.DOTALL)
+    return [int(v) for v in re.findall(r"\d+", match.group(1))]
+
+
 class TestBayerMatrix(unittest.TestCase):
     """Test the Bayer 4x4 matrix."""
 
@@ -141,6 +160,51 @@ class TestPatternTest(unittest.TestCase):
                     f"Pattern should tile at ({x}, {y})"
                 )
 
+    def test_matches_bayer_threshold_rule(self):
+        """Packed masks should agree with BAYER_4X4[y][x] < threshold."""
+        thresholds = {
+            Pattern.SOLID_BLACK: 16,
+            Pattern.DENSE: 12,
+            Pattern.MEDIUM: 8,
+            Pattern.SPARSE: 4,
+            Pattern.SOLID_WHITE: 0,
+        }
+        for pattern, threshold in thresholds.items():
+            for y in range(4):
+                for x in range(4):
+                    self.assertEqual(
+                        pattern_test(pattern, x, y),
+                        BAYER_4X4[y][x] < threshold,
+                        f"Pattern {pattern} mismatch at ({x}, {y})"
+                    )
+
+    @unittest.skipUnless(_FIRMWARE_DIR.is_dir(), "firmware sources not present")
+    def test_packed_masks_match_firmware(self):
+        """Packed masks should follow the firmware's BAYER_4X4 and PATTERN_THRESHOLDS."""
+        cpp = (_FIRMWARE_DIR / "src" / "patterns.cpp").read_text()
+        hpp = (_FIRMWARE_DIR / "include" / "rendering" / "patterns.hpp").read_text()
+        bayer_values = _int_list(r"BAYER_4X4\[4\]\[4\]\s*=\s*\{(.*?)\};", cpp)
+        thresholds = _int_list(r"PATTERN_THRESHOLDS\[\]\s*=\s*\{(.*?)\};", hpp)
+
+        bayer = [bayer_values[row * 4:row * 4 + 4] for row in range(4)]
+        self.assertEqual(bayer, BAYER_4X4)
+
+        # Bit (y*4 + x) is set iff BAYER_4X4[y][x] < threshold
+        for pattern in (Pattern.SOLID_BLACK, Pattern.DENSE, Pattern.MEDIUM,
+                        Pattern.SPARSE, Pattern.SOLID_WHITE):
+            expected = 0
+            for i, value in enumerate(bayer_values):
+                if value < thresholds[pattern]:
+                    expected |= 1 << i
+            self.assertEqual(_PATTERN_MASKS[pattern], expected,
+                             f"Pattern {pattern} mask differs from firmware")
+
+    def test_unknown_pattern_fills_nothing(self):
+        """Unknown pattern values should never fill."""
+        for x in range(4):
+            for y in range(4):
+                self.assertFalse(pattern_test(99, x, y))
+
     def test_pattern_at_negative_coords(self):
         """Pattern should handle negative coordinates via modulo."""
         # pattern_test uses & 3 which works like modulo for negative numbers
@@ -178,7 +242,7 @@ class TestFillPolygonPattern(unittest.TestCase):
         fill_polygon_pattern(fb, points, Pattern.SOLID_WHITE)
 
         # No pixels should be filled
-        self.assertTrue(all(b == 0 for b in fb.buffer))
+        self.assertTrue(fb.is_empty())
 
     def test_fill_square_medium_density(self):
         """Fill square with MEDIUM should have ~50% filled pixels."""
@@ -251,15 +315,15 @@ class TestFillPolygonPattern(unittest.TestCase):
         """Fill with fewer than 3 points should do nothing."""
         fb = Framebuffer()
         fill_polygon_pattern(fb, [(10, 10), (20, 20)], Pattern.SOLID_BLACK)
-        self.assertTrue(all(b == 0 for b in fb.buffer))
+        self.assertTrue(fb.is_empty())
 
         fb2 = Framebuffer()
         fill_polygon_pattern(fb2, [(10, 10)], Pattern.SOLID_BLACK)
-        self.assertTrue(all(b == 0 for b in fb2.buffer))
+        self.assertTrue(fb2.is_empty())
 
         fb3 = Framebuffer()
         fill_polygon_pattern(fb3, [], Pattern.SOLID_BLACK)
-        self.assertTrue(all(b == 0 for b in fb3.buffer))
+        self.assertTrue(fb3.is_empty())
 
     def test_pattern_alignment_global(self):
         """Two adjacent polygons should have aligned patterns."""
@@ -299,6 +363,123 @@ class TestFillPolygonPattern(unittest.TestCase):
                     f"Pattern should match at ({x}, {y})"
                 )
 
+    def test_matches_per_pixel_reference(self):
+        """Byte-wise span fill should match a per-pixel pattern_test fill."""
+        shapes = [
+            [(3, 2), (61, 5), (40, 47), (1, 30)],
+            [(-20, -10), (420, 40), (200, 320)],  # Clipped on every side
+            [(5, 5), (6, 5), (6, 9), (5, 9)],     # Spans inside one byte
+            [(-7, 290), (-7, 250), (405, 250), (405, 290)],  # Clipped rect
+            # Concave star: edges enter and leave the active set mid-shape
+            [(100, 10), (115, 60), (170, 60), (125, 90), (145, 150),
+             (100, 110), (55, 150), (75, 90), (30, 60), (85, 60)],
+        ]
+        for pattern in [Pattern.SOLID_BLACK, Pattern.DENSE,
+                        Pattern.MEDIUM, Pattern.SPARSE]:
+            for points in shapes:
+                fb = Framebuffer()
+                ref = Framebuffer()
+                # Existing ink must be preserved by the OR
+                fb.fill_span(20, 0, 400, True)
+                ref.fill_span(20, 0, 400, True)
+
+                fill_polygon_pattern(fb, points, pattern)
+                _reference_fill(ref, points, pattern)
+
+                self.assertEqual(
+                    fb.buffer, ref.buffer,
+                    f"Pattern {pattern} mismatch for {points}"
+                )
+
+
+class TestFillRectPattern(unittest.TestCase):
+    """Test fill_rect_pattern function."""
+
+    def test_matches_polygon_fill(self):
+        """fill_rect_pattern should match the scanline fill of its outline."""
+        # Polygon rows are top..bottom-1 and columns left..right inclusive
+        for x, y, w, h in [(3, 4, 30, 9), (-5, -5, 20, 12), (390, 295, 20, 20),
+                           (9, 0, 5, 3)]:
+            for pattern in [Pattern.DENSE, Pattern.MEDIUM, Pattern.SPARSE]:
+                fb = Framebuffer()
+                ref = Framebuffer()
+                fill_rect_pattern(fb, x, y, w, h, pattern)
+                left, top = x, y
+                right, bottom = x + w - 1, y + h
+                _reference_fill(ref, [(left, top), (right, top),
+                                      (right, bottom), (left, bottom)], pattern)
+                self.assertEqual(
+                    fb.buffer, ref.buffer,
+                    f"Pattern {pattern} mismatch for rect {(x, y, w, h)}"
+                )
+
+    def test_empty_and_white(self):
+        """Empty rectangles and SOLID_WHITE should draw nothing."""
+        fb = Framebuffer()
+        fill_rect_pattern(fb, 10, 10, 0, 10, Pattern.SOLID_BLACK)
+        fill_rect_pattern(fb, 10, 10, 10, -1, Pattern.SOLID_BLACK)
+        fill_rect_pattern(fb, 10, 10, 10, 10, Pattern.SOLID_WHITE)
+        fill_rect_pattern(fb, 500, 10, 10, 10, Pattern.SOLID_BLACK)
+        self.assertTrue(fb.is_empty())
+
+    def test_bowtie_not_treated_as_rect(self):
+        """A self-intersecting quad on two x/y values is not a rectangle."""
+        fb = Framebuffer()
+        ref = Framebuffer()
+        points = [(10, 10), (30, 10), (10, 30), (30, 30)]
+        fill_polygon_pattern(fb, points, Pattern.SOLID_BLACK)
+        _reference_fill(ref, points, Pattern.SOLID_BLACK)
+        self.assertEqual(fb.buffer, ref.buffer)
+
+    def test_repeated_vertex_not_treated_as_rect(self):
+        """A quad with a repeated corner is a degenerate sliver, not a rectangle."""
+        for points in ([(0, 0), (10, 0), (10, 10), (10, 0)],
+                       [(20, 20), (40, 20), (40, 20), (20, 40)]):
+            with self.subTest(points=points):
+                fb = Framebuffer()
+                ref = Framebuffer()
+                fill_polygon_pattern(fb, points, Pattern.SOLID_BLACK)
+                _reference_fill(ref, points, Pattern.SOLID_BLACK)
+                self.assertEqual(fb.buffer, ref.buffer)
+
+    def test_rect_from_array_and_nested_lists(self):
+        """4-point NumPy arrays and lists of lists should fill like tuples."""
+        corners = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        ref = Framebuffer()
+        _reference_fill(ref, corners, Pattern.MEDIUM)
+        inputs = {
+            "int32 array": np.array(corners, dtype=np.int32),
+            "list of lists": [list(p) for p in corners],
+        }
+        for name, points in inputs.items():
+            with self.subTest(points=name):
+                fb = Framebuffer()
+                fill_polygon_pattern(fb, points, Pattern.MEDIUM)
+                self.assertEqual(fb.buffer, ref.buffer)
+
+
+def _reference_fill(fb, points, pattern):
+    """Per-pixel scanline fill used to cross-check fill_polygon_pattern."""
+    n = len(points)
+    min_y = max(0, min(p[1] for p in points))
+    max_y = min(fb.HEIGHT - 1, max(p[1] for p in points))
+    for y in range(min_y, max_y + 1):
+        xs = []
+        for i in range(n):
+            x0, y0 = points[i]
+            x1, y1 = points[(i + 1) % n]
+            if y0 == y1:
+                continue
+            if y0 > y1:
+                x0, y0, x1, y1 = x1, y1, x0, y0
+            if y0 <= y < y1:
+                xs.append(x0 + (y - y0) * (x1 - x0) // (y1 - y0))
+        xs.sort()
+        for i in range(0, len(xs) - 1, 2):
+            for x in range(xs[i], xs[i + 1] + 1):
+                if pattern_test(pattern, x, y):
+                    fb.set_pixel(x, y, True)
+
 
 class TestPatternIntegration(unittest.TestCase):
     """Integration tests for patterns."""
@@ -316,7 +497,7 @@ class TestPatternIntegration(unittest.TestCase):
             fb = Framebuffer()
             points = [(0, 0), (16, 0), (16, 16), (0, 16)]
             fill_polygon_pattern(fb, points, pattern)
-            count = sum(1 for x in range(17) for y in range(16) if fb.get_pixel(x, y))
+            count = sum(1 for y in range(16) for x in range(17) if fb.get_pixel(x, y))
             results[pattern] = count
 
         # All counts should be different
@@ -343,7 +524,8 @@ class TestPatternIntegration(unittest.TestCase):
 
         # Should have approximately 50% pixels filled
         total = fb.WIDTH * (fb.HEIGHT - 1)  # y=299 not filled
-        filled = sum(1 for x in range(fb.WIDTH) for y in range(fb.HEIGHT - 1) if fb.get_pixel(x, y))
+        rows = fb.buffer[:(fb.HEIGHT - 1) * fb.BYTES_PER_ROW]
+        filled = count_set_bits(rows)
         self.assertAlmostEqual(filled / total, 0.5, delta=0.05)
 
 
@@ -11,7 +11,11 @@ These tests verify:
 """
 
 import unittest
+
+import numpy as np
+
 from rendering.framebuffer import Framebuffer
+from rendering._testing import count_pixels
 from rendering.primitives import (
     draw_line,
     draw_polygon,
@@ -21,55 +25,166 @@ from rendering.primitives import (
     fill_circle,
 )
 
-
-class TestDrawLine(unittest.TestCase):
+# Row/column index grids shared by the distance-mask checks; broadcasting
+# (_XX - cx) ** 2 + (_YY - cy) ** 2 gives a (HEIGHT, WIDTH) array
+_YY, _XX = np.ogrid[:Framebuffer.HEIGHT, :Framebuffer.WIDTH]
+
+
+def _row_popcounts(fb):
+    """Number of black pixels in each row, as a length-HEIGHT array."""
+    rows = np.frombuffer(fb.buffer, dtype=np.uint8).reshape(fb.HEIGHT, fb.BYTES_PER_ROW)
+    return np.unpackbits(rows, axis=1).sum(axis=1)
+
+
+def _as_array(fb):
+    """Unpack the framebuffer into a (HEIGHT, WIDTH) bool array (MSB = left)."""
+    bits = np.unpackbits(np.frombuffer(fb.buffer, dtype=np.uint8))
+    return bits.reshape(fb.HEIGHT, fb.WIDTH).astype(bool)
+
+
+def _reference_line(fb, x0, y0, x1, y1, color):
+    """Plain Bresenham through set_pixel, used as the expected output."""
+    dx = abs(x1 - x0)
+    dy = abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx - dy
+    x, y = x0, y0
+    while True:
+        fb.set_pixel(x, y, color)
+        if x == x1 and y == y1:
+            break
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x += sx
+        if e2 < dx:
+            err += dx
+            y += sy
+
+
+def _expected_line_mask(x0, y0, x1, y1):
+    """
+    Vectorized Bresenham: the full (HEIGHT, WIDTH) mask of an on-screen line.
+
+    Steps the major axis one pixel at a time; the minor axis is the exact
+    integer rounding of the ideal line with ties going toward the start
+    point, which is what draw_line's error term produces.
+    """
+    dx, dy = abs(x1 - x0), abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    if dx >= dy:
+        i = np.arange(dx + 1)
+        xs = x0 + sx * i
+        ys = y0 + sy * ((2 * i * dy + dx - 1) // (2 * dx)) if dx else i + y0
+    else:
+        i = np.arange(dy + 1)
+        ys = y0 + sy * i
+        xs = x0 + sx * ((2 * i * dx + dy - 1) // (2 * dy))
+    expected = np.zeros((Framebuffer.HEIGHT, Framebuffer.WIDTH), dtype=bool)
+    expected[ys, xs] = True
+    return expected
+
+
+def _reference_polygon_mask(points):
+    """Even-odd scanline fill that tests every edge on every row."""
+    expected = np.zeros((Framebuffer.HEIGHT, Framebuffer.WIDTH), dtype=bool)
+    n = len(points)
+    for y in range(Framebuffer.HEIGHT):
+        xs = []
+        for i in range(n):
+            x0, y0 = points[i]
+            x1, y1 = points[(i + 1) % n]
+            if y0 > y1:
+                x0, y0, x1, y1 = x1, y1, x0, y0
+            if y0 <= y < y1:
+                xs.append(x0 + (y - y0) * (x1 - x0) // (y1 - y0))
+        xs.sort()
+        for i in range(0, len(xs) - 1, 2):
+            expected[y, max(0, xs[i]):max(0, xs[i + 1] + 1)] = True
+    return expected
+
+
+class _SharedFramebufferTestCase(unittest.TestCase):
+    """Reuses one framebuffer (plus a small scratch pool) per test class.
+
+    Each test starts from a white buffer; clearing is a single slice
+    assignment, much cheaper than allocating a new Framebuffer.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fb = Framebuffer()
+        cls._scratch = [Framebuffer() for _ in range(2)]
+
+    def setUp(self):
+        self.fb.clear(False)
+        for scratch in self._scratch:
+            scratch.clear(False)
+
+    def _assert_buffer_matches_mask(self, fb, mask):
+        """Compare the packed buffer byte-for-byte against a (H, W) bool mask."""
+        expected = np.packbits(mask, axis=1).tobytes()
+        self.assertEqual(bytes(fb.buffer), expected)
+
+
+class TestDrawLine(_SharedFramebufferTestCase):
     """Test Bresenham's line algorithm."""
 
     def test_horizontal_line(self):
         """Draw a horizontal line."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_line(fb, 10, 50, 20, 50, True)
 
-        for x in range(10, 21):
-            self.assertTrue(fb.get_pixel(x, 50), f"Pixel at ({x}, 50) should be set")
+        pixels = _as_array(fb)
+        self.assertTrue(pixels[50, 10:21].all(), "Pixels x=10..20 on y=50 should be set")
 
         # Check adjacent pixels are not set
-        self.assertFalse(fb.get_pixel(9, 50))
-        self.assertFalse(fb.get_pixel(21, 50))
-        self.assertFalse(fb.get_pixel(15, 49))
-        self.assertFalse(fb.get_pixel(15, 51))
+        self.assertFalse(pixels[50, 9])
+        self.assertFalse(pixels[50, 21])
+        self.assertFalse(pixels[49, 15])
+        self.assertFalse(pixels[51, 15])
+
+        # Row 50 holds exactly the 11 line pixels; every other row is empty
+        expected = np.zeros(fb.HEIGHT, dtype=int)
+        expected[50] = 11
+        np.testing.assert_array_equal(_row_popcounts(fb), expected)
 
     def test_vertical_line(self):
         """Draw a vertical line."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_line(fb, 50, 10, 50, 20, True)
 
-        for y in range(10, 21):
-            self.assertTrue(fb.get_pixel(50, y), f"Pixel at (50, {y}) should be set")
+        pixels = _as_array(fb)
+        self.assertTrue(pixels[10:21, 50].all(), "Pixels y=10..20 on x=50 should be set")
+
+        self.assertFalse(pixels[9, 50])
+        self.assertFalse(pixels[21, 50])
 
-        self.assertFalse(fb.get_pixel(50, 9))
-        self.assertFalse(fb.get_pixel(50, 21))
+        # One pixel in each of rows 10..20, none elsewhere
+        expected = np.zeros(fb.HEIGHT, dtype=int)
+        expected[10:21] = 1
+        np.testing.assert_array_equal(_row_popcounts(fb), expected)
 
     def test_diagonal_line_45_degrees(self):
         """Draw a 45-degree diagonal line."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_line(fb, 10, 10, 20, 20, True)
 
-        for i in range(11):
-            self.assertTrue(fb.get_pixel(10 + i, 10 + i))
+        np.testing.assert_array_equal(_as_array(fb), _expected_line_mask(10, 10, 20, 20))
 
     def test_diagonal_line_negative_slope(self):
         """Draw a diagonal line with negative slope."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_line(fb, 10, 20, 20, 10, True)
 
-        for i in range(11):
-            self.assertTrue(fb.get_pixel(10 + i, 20 - i))
+        np.testing.assert_array_equal(_as_array(fb), _expected_line_mask(10, 20, 20, 10))
 
     def test_line_reversed_endpoints(self):
         """Line should have same endpoints regardless of order."""
-        fb1 = Framebuffer()
-        fb2 = Framebuffer()
+        fb1 = self.fb
+        fb2 = self._scratch[0]
 
         draw_line(fb1, 10, 10, 50, 30, True)
         draw_line(fb2, 50, 30, 10, 10, True)
@@ -82,38 +197,52 @@ class TestDrawLine(unittest.TestCase):
 
         # Lines should have same pixel count (may differ by at most 1 pixel
         # due to integer rounding in different directions)
-        count1 = sum(1 for x in range(60) for y in range(40) if fb1.get_pixel(x, y))
-        count2 = sum(1 for x in range(60) for y in range(40) if fb2.get_pixel(x, y))
+        count1 = count_pixels(fb1)
+        count2 = count_pixels(fb2)
         self.assertAlmostEqual(count1, count2, delta=1)
 
+        # Each direction traces its own exact Bresenham path
+        np.testing.assert_array_equal(_as_array(fb1), _expected_line_mask(10, 10, 50, 30))
+        np.testing.assert_array_equal(_as_array(fb2), _expected_line_mask(50, 30, 10, 10))
+
+        # With an odd major-axis delta no step is a tie, so both directions
+        # trace the same path: the two buffers are identical
+        fb1.clear(False)
+        fb2.clear(False)
+        draw_line(fb1, 10, 10, 51, 30, True)
+        draw_line(fb2, 51, 30, 10, 10, True)
+        self.assertEqual(fb1.buffer, fb2.buffer)
+
     def test_single_point_line(self):
         """Line from point to same point should draw single pixel."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_line(fb, 100, 100, 100, 100, True)
 
         self.assertTrue(fb.get_pixel(100, 100))
 
         # Count set pixels - should be exactly 1
-        count = sum(1 for x in range(fb.WIDTH) for y in range(fb.HEIGHT) if fb.get_pixel(x, y))
+        count = count_pixels(fb)
         self.assertEqual(count, 1)
 
     def test_steep_line(self):
         """Draw a steep line (dy > dx)."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_line(fb, 10, 10, 15, 30, True)
 
         # Check endpoints
         self.assertTrue(fb.get_pixel(10, 10))
         self.assertTrue(fb.get_pixel(15, 30))
+        np.testing.assert_array_equal(_as_array(fb), _expected_line_mask(10, 10, 15, 30))
 
     def test_shallow_line(self):
         """Draw a shallow line (dx > dy)."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_line(fb, 10, 10, 30, 15, True)
 
         # Check endpoints
         self.assertTrue(fb.get_pixel(10, 10))
         self.assertTrue(fb.get_pixel(30, 15))
+        np.testing.assert_array_equal(_as_array(fb), _expected_line_mask(10, 10, 30, 15))
 
     def test_line_all_octants(self):
         """Test lines in all 8 octants from center point."""
@@ -128,30 +257,54 @@ class TestDrawLine(unittest.TestCase):
             (0, 0),     # Up-left
         ]
 
+        fb = self.fb
         for ex, ey in endpoints:
-            fb = Framebuffer()
-            draw_line(fb, 50, 50, ex, ey, True)
+            with self.subTest(endpoint=(ex, ey)):
+                fb.clear(False)
+                draw_line(fb, 50, 50, ex, ey, True)
 
-            # Both endpoints should be set
-            self.assertTrue(fb.get_pixel(50, 50), f"Center not set for line to ({ex}, {ey})")
-            self.assertTrue(fb.get_pixel(ex, ey), f"Endpoint ({ex}, {ey}) not set")
+                # Both endpoints should be set
+                self.assertTrue(fb.get_pixel(50, 50), "Center not set")
+                self.assertTrue(fb.get_pixel(ex, ey), "Endpoint not set")
+                np.testing.assert_array_equal(
+                    _as_array(fb), _expected_line_mask(50, 50, ex, ey))
 
     def test_line_with_white(self):
         """Draw a white line on black background."""
-        fb = Framebuffer()
+        fb = self.fb
         fb.clear(True)  # All black
         draw_line(fb, 10, 10, 20, 10, False)
 
-        for x in range(10, 21):
-            self.assertFalse(fb.get_pixel(x, 10))
-
-
-class TestDrawPolygon(unittest.TestCase):
+        self.assertFalse(_as_array(fb)[10, 10:21].any())
+
+    def test_matches_set_pixel_reference(self):
+        """Direct byte writes match a per-pixel Bresenham, including clipping."""
+        cases = [
+            (10, 10, 390, 290),   # fully on screen
+            (5, 200, 300, 200),   # horizontal span
+            (-30, -20, 420, 310), # clipped at both ends
+            (399, 0, 0, 299),     # corner to corner
+            (-5, 150, 40, 150),   # horizontal, clipped left
+            (200, -10, 200, 310), # vertical, clipped
+        ]
+        for color in (True, False):
+            for x0, y0, x1, y1 in cases:
+                fb = self.fb
+                expected = self._scratch[0]
+                fb.clear(not color)
+                expected.clear(not color)
+                draw_line(fb, x0, y0, x1, y1, color)
+                _reference_line(expected, x0, y0, x1, y1, color)
+                self.assertEqual(fb.buffer, expected.buffer,
+                                 f"Mismatch for {(x0, y0, x1, y1)} color={color}")
+
+
+class TestDrawPolygon(_SharedFramebufferTestCase):
     """Test polygon outline drawing."""
 
     def test_triangle(self):
         """Draw a triangle outline."""
-        fb = Framebuffer()
+        fb = self.fb
         points = [(50, 10), (10, 90), (90, 90)]
         draw_polygon(fb, points, True)
 
@@ -161,48 +314,51 @@ class TestDrawPolygon(unittest.TestCase):
 
     def test_square(self):
         """Draw a square outline."""
-        fb = Framebuffer()
+        fb = self.fb
         points = [(10, 10), (50, 10), (50, 50), (10, 50)]
         draw_polygon(fb, points, True)
 
-        # Check all four edges
-        # Top edge
-        for x in range(10, 51):
-            self.assertTrue(fb.get_pixel(x, 10))
-        # Bottom edge
-        for x in range(10, 51):
-            self.assertTrue(fb.get_pixel(x, 50))
-        # Left edge
-        for y in range(10, 51):
-            self.assertTrue(fb.get_pixel(10, y))
-        # Right edge
-        for y in range(10, 51):
-            self.assertTrue(fb.get_pixel(50, y))
+        # Top and bottom edges cover x=10..50: bytes 1..6 of the row,
+        # partial at both ends (bit 7 = leftmost pixel)
+        edge = b"\x3f" + b"\xff" * 4 + b"\xe0"
+        self.assertEqual(fb.get_row_bytes(10, 10, 51), edge)
+        self.assertEqual(fb.get_row_bytes(50, 10, 51), edge)
+
+        # Left and right edges
+        pixels = _as_array(fb)
+        self.assertTrue(pixels[10:51, 10].all())
+        self.assertTrue(pixels[10:51, 50].all())
 
     def test_single_point(self):
         """Single point polygon should draw nothing."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_polygon(fb, [(10, 10)], True)
 
         # Should be empty
-        self.assertTrue(all(b == 0 for b in fb.buffer))
+        self.assertTrue(fb.is_empty())
 
     def test_two_points(self):
         """Two points should draw a line between them."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_polygon(fb, [(10, 10), (20, 10)], True)
 
-        for x in range(10, 21):
-            self.assertTrue(fb.get_pixel(x, 10))
+        self.assertTrue(_as_array(fb)[10, 10:21].all())
 
     def test_empty_polygon(self):
         """Empty polygon should draw nothing."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_polygon(fb, [], True)
-        self.assertTrue(all(b == 0 for b in fb.buffer))
+        self.assertTrue(fb.is_empty())
+
+    def test_numpy_points_match_list(self):
+        """An (N, 2) int32 array draws exactly what the list of tuples does."""
+        points = [(10, 30), (30, 10), (30, 20), (50, 20), (50, 40), (30, 40), (30, 50)]
+        draw_polygon(self.fb, points, True)
+        draw_polygon(self._scratch[0], np.asarray(points, dtype=np.int32), True)
+        self.assertEqual(self.fb.buffer, self._scratch[0].buffer)
 
 
-class TestFillPolygon(unittest.TestCase):
+class TestFillPolygon(_SharedFramebufferTestCase):
     """Test scanline fill algorithm."""
 
     def test_fill_square(self):
@@ -212,22 +368,20 @@ class TestFillPolygon(unittest.TestCase):
         so the bottom edge at y=max_y is not filled. This is standard
         behavior for scanline algorithms.
         """
-        fb = Framebuffer()
+        fb = self.fb
         points = [(10, 10), (20, 10), (20, 20), (10, 20)]
         fill_polygon(fb, points, True)
 
-        # Interior pixels should be filled (y from 10 to 19, x from 10 to 20)
-        for x in range(10, 21):
-            for y in range(10, 20):  # Note: y=20 is not filled (exclusive)
-                self.assertTrue(fb.get_pixel(x, y), f"Pixel ({x}, {y}) should be set")
-
+        # Exactly y from 10 to 19, x from 10 to 20 should be filled.
         # Bottom edge at y=20 is NOT filled (standard scanline behavior)
         # This prevents double-filling when polygons share edges
-        self.assertFalse(fb.get_pixel(15, 20))
+        expected = np.zeros((fb.HEIGHT, fb.WIDTH), dtype=bool)
+        expected[10:20, 10:21] = True
+        np.testing.assert_array_equal(_as_array(fb), expected)
 
     def test_fill_triangle(self):
         """Fill a triangle."""
-        fb = Framebuffer()
+        fb = self.fb
         points = [(50, 10), (10, 50), (90, 50)]
         fill_polygon(fb, points, True)
 
@@ -241,9 +395,11 @@ class TestFillPolygon(unittest.TestCase):
 
     def test_fill_concave_polygon(self):
         """Fill a simple concave polygon (arrow shape)."""
-        fb = Framebuffer()
+        fb = self.fb
         # Arrow pointing right
-        points = [(10, 30), (30, 10), (30, 20), (50, 20), (50, 40), (30, 40), (30, 50)]
+        points = np.asarray(
+            [(10, 30), (30, 10), (30, 20), (50, 20), (50, 40), (30, 40), (30, 50)],
+            dtype=np.int32)
         fill_polygon(fb, points, True)
 
         # Check some interior points
@@ -252,21 +408,21 @@ class TestFillPolygon(unittest.TestCase):
 
     def test_fill_too_few_points(self):
         """Filling with fewer than 3 points should do nothing."""
-        fb = Framebuffer()
+        fb = self.fb
         fill_polygon(fb, [(10, 10), (20, 20)], True)
-        self.assertTrue(all(b == 0 for b in fb.buffer))
+        self.assertTrue(fb.is_empty())
 
-        fb2 = Framebuffer()
+        fb2 = self._scratch[0]
         fill_polygon(fb2, [(10, 10)], True)
-        self.assertTrue(all(b == 0 for b in fb2.buffer))
+        self.assertTrue(fb2.is_empty())
 
-        fb3 = Framebuffer()
+        fb3 = self._scratch[1]
         fill_polygon(fb3, [], True)
-        self.assertTrue(all(b == 0 for b in fb3.buffer))
+        self.assertTrue(fb3.is_empty())
 
     def test_fill_with_white(self):
         """Fill polygon with white on black background."""
-        fb = Framebuffer()
+        fb = self.fb
         fb.clear(True)
         points = [(10, 10), (20, 10), (20, 20), (10, 20)]
         fill_polygon(fb, points, False)
@@ -276,33 +432,39 @@ class TestFillPolygon(unittest.TestCase):
         # Exterior should still be black
         self.assertTrue(fb.get_pixel(5, 5))
 
+    def test_matches_naive_scanline_reference(self):
+        """Active-edge-table fill matches testing every edge on every row."""
+        shapes = [
+            [(10, 30), (30, 10), (30, 20), (50, 20), (50, 40), (30, 40), (30, 50)],
+            [(-10, 50), (50, -10), (110, 50), (50, 110)],
+            [(200, 5), (230, 120), (390, 130), (250, 180), (300, 295),
+             (200, 210), (100, 295), (150, 180), (10, 130), (170, 120)],
+            [(5, 5), (395, 150), (5, 295), (200, 150)],
+        ]
+        for points in shapes:
+            with self.subTest(points=points):
+                self.fb.clear(False)
+                fill_polygon(self.fb, points, True)
+                np.testing.assert_array_equal(
+                    _as_array(self.fb), _reference_polygon_mask(points))
+
 
-class TestFillRect(unittest.TestCase):
+class TestFillRect(_SharedFramebufferTestCase):
     """Test rectangle fill."""
 
     def test_basic_rect(self):
         """Fill a basic rectangle."""
-        fb = Framebuffer()
+        fb = self.fb
         fill_rect(fb, 10, 20, 30, 40, True)
 
-        # Check corners
-        self.assertTrue(fb.get_pixel(10, 20))
-        self.assertTrue(fb.get_pixel(39, 20))
-        self.assertTrue(fb.get_pixel(10, 59))
-        self.assertTrue(fb.get_pixel(39, 59))
-
-        # Check interior
-        self.assertTrue(fb.get_pixel(25, 40))
-
-        # Check just outside
-        self.assertFalse(fb.get_pixel(9, 40))
-        self.assertFalse(fb.get_pixel(40, 40))
-        self.assertFalse(fb.get_pixel(25, 19))
-        self.assertFalse(fb.get_pixel(25, 60))
+        # Exactly x 10..39, y 20..59 should be set, nothing outside
+        expected = np.zeros((fb.HEIGHT, fb.WIDTH), dtype=bool)
+        expected[20:60, 10:40] = True
+        np.testing.assert_array_equal(_as_array(fb), expected)
 
     def test_rect_1x1(self):
         """Single pixel rectangle."""
-        fb = Framebuffer()
+        fb = self.fb
         fill_rect(fb, 100, 100, 1, 1, True)
 
         self.assertTrue(fb.get_pixel(100, 100))
@@ -311,53 +473,60 @@ class TestFillRect(unittest.TestCase):
 
     def test_rect_zero_dimensions(self):
         """Zero or negative dimensions should draw nothing."""
-        fb = Framebuffer()
+        fb = self.fb
         fill_rect(fb, 10, 10, 0, 10, True)
-        self.assertTrue(all(b == 0 for b in fb.buffer))
+        self.assertTrue(fb.is_empty())
 
-        fb2 = Framebuffer()
+        fb2 = self._scratch[0]
         fill_rect(fb2, 10, 10, 10, 0, True)
-        self.assertTrue(all(b == 0 for b in fb2.buffer))
+        self.assertTrue(fb2.is_empty())
 
-        fb3 = Framebuffer()
+        fb3 = self._scratch[1]
         fill_rect(fb3, 10, 10, -5, 10, True)
-        self.assertTrue(all(b == 0 for b in fb3.buffer))
+        self.assertTrue(fb3.is_empty())
 
     def test_rect_full_row(self):
         """Fill entire row."""
-        fb = Framebuffer()
+        fb = self.fb
         fill_rect(fb, 0, 50, 400, 1, True)
 
-        for x in range(400):
-            self.assertTrue(fb.get_pixel(x, 50))
-        self.assertFalse(fb.get_pixel(0, 49))
-        self.assertFalse(fb.get_pixel(0, 51))
+        # A full row is exactly one run of 0xFF bytes; every other row,
+        # including the neighbours at y=49 and y=51, stays zero
+        row_bytes = fb.BYTES_PER_ROW
+        self.assertEqual(fb.buffer[50 * row_bytes:51 * row_bytes], b"\xff" * row_bytes)
+        self.assertEqual(fb.buffer[:50 * row_bytes], bytes(50 * row_bytes))
+        self.assertEqual(fb.buffer[51 * row_bytes:], bytes((fb.HEIGHT - 51) * row_bytes))
 
     def test_rect_clipping(self):
         """Rectangle should be clipped at framebuffer boundaries."""
-        fb = Framebuffer()
+        fb = self.fb
         fill_rect(fb, 390, 290, 20, 20, True)
 
         # Pixels within bounds should be set
         self.assertTrue(fb.get_pixel(395, 295))
         self.assertTrue(fb.get_pixel(399, 299))
 
+        # Exactly the on-screen 10x10 corner, nothing else
+        mask = np.zeros((fb.HEIGHT, fb.WIDTH), dtype=bool)
+        mask[290:310, 390:410] = True
+        self._assert_buffer_matches_mask(fb, mask)
+
 
-class TestDrawCircle(unittest.TestCase):
+class TestDrawCircle(_SharedFramebufferTestCase):
     """Test midpoint circle algorithm."""
 
     def test_circle_radius_0(self):
         """Circle with radius 0 should be a single pixel."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_circle(fb, 100, 100, 0, True)
 
         self.assertTrue(fb.get_pixel(100, 100))
-        count = sum(1 for x in range(fb.WIDTH) for y in range(fb.HEIGHT) if fb.get_pixel(x, y))
+        count = count_pixels(fb)
         self.assertEqual(count, 1)
 
     def test_circle_radius_1(self):
         """Circle with radius 1."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_circle(fb, 100, 100, 1, True)
 
         # Cardinal points should be set
@@ -372,26 +541,21 @@ class TestDrawCircle(unittest.TestCase):
 
     def test_circle_symmetry(self):
         """Circle should be symmetric in all 8 octants."""
-        fb = Framebuffer()
+        fb = self.fb
         cx, cy, r = 100, 100, 30
         draw_circle(fb, cx, cy, r, True)
 
-        # Check 8-way symmetry
-        for x in range(r + 1):
-            for y in range(r + 1):
-                if fb.get_pixel(cx + x, cy + y):
-                    self.assertTrue(fb.get_pixel(cx - x, cy + y),
-                                  f"Symmetry failed at ({cx - x}, {cy + y})")
-                    self.assertTrue(fb.get_pixel(cx + x, cy - y))
-                    self.assertTrue(fb.get_pixel(cx - x, cy - y))
-                    self.assertTrue(fb.get_pixel(cx + y, cy + x))
-                    self.assertTrue(fb.get_pixel(cx - y, cy + x))
-                    self.assertTrue(fb.get_pixel(cx + y, cy - x))
-                    self.assertTrue(fb.get_pixel(cx - y, cy - x))
+        # Check 8-way symmetry on the square centred on the circle (with a
+        # one-pixel margin so stray pixels outside the radius are caught)
+        sub = _as_array(fb)[cy - r - 1:cy + r + 2, cx - r - 1:cx + r + 2]
+        self.assertTrue(sub.any())
+        self.assertTrue(np.array_equal(sub, sub[::-1, :]), "Not symmetric top/bottom")
+        self.assertTrue(np.array_equal(sub, sub[:, ::-1]), "Not symmetric left/right")
+        self.assertTrue(np.array_equal(sub, sub.T), "Not symmetric about the diagonal")
 
     def test_circle_radius_10(self):
         """Circle with radius 10 should have correct points."""
-        fb = Framebuffer()
+        fb = self.fb
         cx, cy, r = 100, 100, 10
         draw_circle(fb, cx, cy, r, True)
 
@@ -403,35 +567,35 @@ class TestDrawCircle(unittest.TestCase):
 
     def test_circle_negative_radius(self):
         """Negative radius should draw nothing."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_circle(fb, 100, 100, -5, True)
-        self.assertTrue(all(b == 0 for b in fb.buffer))
+        self.assertTrue(fb.is_empty())
 
     def test_circle_at_origin(self):
         """Circle near origin should clip correctly."""
-        fb = Framebuffer()
+        fb = self.fb
         draw_circle(fb, 10, 10, 5, True)
 
         # Should have some pixels set
-        pixel_count = sum(1 for x in range(fb.WIDTH) for y in range(fb.HEIGHT) if fb.get_pixel(x, y))
+        pixel_count = count_pixels(fb)
         self.assertGreater(pixel_count, 0)
 
 
-class TestFillCircle(unittest.TestCase):
+class TestFillCircle(_SharedFramebufferTestCase):
     """Test filled circle using spans."""
 
     def test_fill_circle_radius_0(self):
         """Filled circle with radius 0 should be a single pixel."""
-        fb = Framebuffer()
+        fb = self.fb
         fill_circle(fb, 100, 100, 0, True)
 
         self.assertTrue(fb.get_pixel(100, 100))
-        count = sum(1 for x in range(fb.WIDTH) for y in range(fb.HEIGHT) if fb.get_pixel(x, y))
+        count = count_pixels(fb)
         self.assertEqual(count, 1)
 
     def test_fill_circle_radius_1(self):
         """Filled circle with radius 1 should fill the cross pattern."""
-        fb = Framebuffer()
+        fb = self.fb
         fill_circle(fb, 100, 100, 1, True)
 
         # Center and cardinal points should be filled
@@ -443,7 +607,7 @@ class TestFillCircle(unittest.TestCase):
 
     def test_fill_circle_filled_completely(self):
         """All pixels within radius should be filled."""
-        fb = Framebuffer()
+        fb = self.fb
         cx, cy, r = 100, 100, 20
         fill_circle(fb, cx, cy, r, True)
 
@@ -451,50 +615,42 @@ class TestFillCircle(unittest.TestCase):
         self.assertTrue(fb.get_pixel(cx, cy))
 
         # Check points inside should be filled
-        # A point at distance < r from center should be filled
-        for x in range(cx - r, cx + r + 1):
-            for y in range(cy - r, cy + r + 1):
-                dist_sq = (x - cx) ** 2 + (y - cy) ** 2
-                if dist_sq < (r - 1) ** 2:  # Well inside the circle
-                    self.assertTrue(fb.get_pixel(x, y),
-                                  f"Interior pixel ({x}, {y}) should be filled")
+        # A point at distance < r - 1 from center is well inside the circle
+        interior = (_XX - cx) ** 2 + (_YY - cy) ** 2 < (r - 1) ** 2
+        self.assertTrue(_as_array(fb)[interior].all(), "Interior pixels should be filled")
 
     def test_fill_circle_not_filled_outside(self):
         """Pixels outside radius should not be filled."""
-        fb = Framebuffer()
+        fb = self.fb
         cx, cy, r = 100, 100, 20
         fill_circle(fb, cx, cy, r, True)
 
-        # Check points well outside
-        self.assertFalse(fb.get_pixel(cx + r + 5, cy))
-        self.assertFalse(fb.get_pixel(cx, cy + r + 5))
-        self.assertFalse(fb.get_pixel(cx - r - 5, cy))
-        self.assertFalse(fb.get_pixel(cx, cy - r - 5))
+        # Nothing beyond r + 1 from the center should be filled
+        exterior = (_XX - cx) ** 2 + (_YY - cy) ** 2 > (r + 1) ** 2
+        self.assertEqual(np.count_nonzero(_as_array(fb) & exterior), 0,
+                         "Exterior pixels should be clear")
 
     def test_fill_circle_negative_radius(self):
         """Negative radius should draw nothing."""
-        fb = Framebuffer()
+        fb = self.fb
         fill_circle(fb, 100, 100, -5, True)
-        self.assertTrue(all(b == 0 for b in fb.buffer))
+        self.assertTrue(fb.is_empty())
 
     def test_fill_circle_symmetry(self):
         """Filled circle should be symmetric."""
-        fb = Framebuffer()
+        fb = self.fb
         cx, cy, r = 100, 100, 25
         fill_circle(fb, cx, cy, r, True)
 
         # Check 4-way symmetry
-        for x in range(r + 2):
-            for y in range(r + 2):
-                if fb.get_pixel(cx + x, cy + y):
-                    self.assertTrue(fb.get_pixel(cx - x, cy + y),
-                                  f"Symmetry failed at ({cx - x}, {cy + y})")
-                    self.assertTrue(fb.get_pixel(cx + x, cy - y))
-                    self.assertTrue(fb.get_pixel(cx - x, cy - y))
+        sub = _as_array(fb)[cy - r - 1:cy + r + 2, cx - r - 1:cx + r + 2]
+        self.assertTrue(sub.any())
+        self.assertTrue(np.array_equal(sub, sub[::-1, :]), "Not symmetric top/bottom")
+        self.assertTrue(np.array_equal(sub, sub[:, ::-1]), "Not symmetric left/right")
 
     def test_fill_circle_with_white(self):
         """Fill circle with white on black background."""
-        fb = Framebuffer()
+        fb = self.fb
         fb.clear(True)
         fill_circle(fb, 100, 100, 20, False)
 
@@ -504,12 +660,12 @@ class TestFillCircle(unittest.TestCase):
         self.assertTrue(fb.get_pixel(150, 100))
 
 
-class TestEdgeCases(unittest.TestCase):
+class TestEdgeCases(_SharedFramebufferTestCase):
     """Test edge cases and boundary conditions."""
 
     def test_draw_at_boundaries(self):
         """Draw primitives at framebuffer boundaries."""
-        fb = Framebuffer()
+        fb = self.fb
 
         # Line at top edge
         draw_line(fb, 0, 0, 100, 0, True)
@@ -529,15 +685,19 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_rect_at_corner(self):
         """Rectangle at corner should clip correctly."""
-        fb = Framebuffer()
+        fb = self.fb
         fill_rect(fb, 390, 290, 20, 20, True)
 
         # Corner should be filled
         self.assertTrue(fb.get_pixel(399, 299))
 
+        mask = np.zeros((fb.HEIGHT, fb.WIDTH), dtype=bool)
+        mask[290:, 390:] = True
+        self._assert_buffer_matches_mask(fb, mask)
+
     def test_circle_at_corner(self):
         """Circle at corner should clip correctly."""
-        fb = Framebuffer()
+        fb = self.fb
         fill_circle(fb, 10, 10, 20, True)
 
         # Origin should not cause issues
@@ -545,16 +705,24 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_large_circle(self):
         """Large circle spanning most of the framebuffer."""
-        fb = Framebuffer()
-        fill_circle(fb, 200, 150, 140, True)
+        fb = self.fb
+        cx, cy, r = 200, 150, 140
+        fill_circle(fb, cx, cy, r, True)
 
         # Center should be filled
-        self.assertTrue(fb.get_pixel(200, 150))
+        self.assertTrue(fb.get_pixel(cx, cy))
+
+        # The midpoint boundary is within a pixel of the true circle, so the
+        # fill must lie between the disks of radius r - 1 and r + 1
+        dist_sq = (_XX - cx) ** 2 + (_YY - cy) ** 2
+        pixels = _as_array(fb)
+        self.assertTrue(pixels[dist_sq <= (r - 1) ** 2].all(), "Interior pixels should be filled")
+        self.assertFalse(pixels[dist_sq > (r + 1) ** 2].any(), "Exterior pixels should be clear")
 
     def test_polygon_outside_bounds(self):
         """Polygon with vertices outside bounds should still work."""
-        fb = Framebuffer()
-        points = [(-10, 50), (50, -10), (110, 50), (50, 110)]
+        fb = self.fb
+        points = np.asarray([(-10, 50), (50, -10), (110, 50), (50, 110)], dtype=np.int32)
         fill_polygon(fb, points, True)
 
         # Some interior pixels should be filled
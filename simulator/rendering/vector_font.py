@@ -13,18 +13,23 @@ Design style:
 - Optimized for 1-bit display with high contrast
 """
 
+from array import array
+from functools import lru_cache
+from typing import Iterable
+from weakref import WeakKeyDictionary
+
 try:
     from .framebuffer import Framebuffer
-    from .primitives import draw_line
+    from .primitives import draw_line, fill_rect
 except ImportError:
     from framebuffer import Framebuffer
-    from primitives import draw_line
+    from primitives import draw_line, fill_rect
 
 
 # Each glyph is a list of strokes. Each stroke is a list of (x, y) points.
 # Coordinates are in a 0-100 unit square, scaled at render time.
 # Strokes are connected polylines - each point connects to the next.
-GLYPHS = {
+_GLYPH_STROKES = {
     # 0: Hexagonal shape with angled corners
     '0': [
         [(20, 10), (80, 10), (95, 25), (95, 75), (80, 90), (20, 90), (5, 75), (5, 25), (20, 10)]
@@ -236,10 +241,57 @@ GLYPHS = {
     ],
 }
 
+# Public glyph table, frozen as tuples of strokes of points. The flattened
+# arrays and render caches below are derived from it, so it must not change
+# after import.
+GLYPHS = {
+    char: tuple(tuple(stroke) for stroke in strokes)
+    for char, strokes in _GLYPH_STROKES.items()
+}
+
 # Backward compatibility alias
 NUMERALS = GLYPHS
 
 
+def _flatten_glyph(strokes: tuple[tuple[tuple[int, int], ...], ...]
+                   ) -> tuple[array, array, array]:
+    """
+    Flatten a glyph's strokes into structure-of-arrays form.
+
+    Returns:
+        (xs, ys, starts): parallel unsigned-byte arrays of every point's
+        coordinates, and the index of each stroke's first point followed
+        by a final end index, so stroke i is xs[starts[i]:starts[i + 1]]
+    """
+    xs = array('B')
+    ys = array('B')
+    starts = array('H')
+    for stroke in strokes:
+        starts.append(len(xs))
+        for x, y in stroke:
+            xs.append(x)
+            ys.append(y)
+    starts.append(len(xs))
+    return xs, ys, starts
+
+
+# Flattened copy of GLYPHS used by the renderer: scaling works on two flat
+# coordinate arrays per glyph instead of unpacking a tuple per point
+_GLYPHS_SOA = {char: _flatten_glyph(strokes) for char, strokes in GLYPHS.items()}
+
+
+# Narrow characters as (numerator, denominator) of the base width; anything
+# not listed is full width. Integer ratios keep the floor division exact.
+_CHAR_WIDTH_RATIOS = {
+    ':': (1, 2),
+    '.': (1, 3),
+    '-': (2, 3),
+    '/': (1, 2),
+    '°': (1, 3),
+    ' ': (1, 2),
+}
+
+
 def _get_char_width(char: str, char_width: int) -> int:
     """
     Get the actual width for a character.
@@ -251,22 +303,10 @@ def _get_char_width(char: str, char_width: int) -> int:
     Returns:
         The actual width for the character
     """
-    if char == ':':
-        return char_width // 2
-    elif char == '.':
-        return char_width // 3
-    elif char == '-':
-        return char_width * 2 // 3
-    elif char == '/':
-        return char_width // 2
-    elif char == '°':
-        return char_width // 3
-    elif char == '%':
-        return char_width
-    elif char == ' ':
-        return char_width // 2
-    else:
+    ratio = _CHAR_WIDTH_RATIOS.get(char)
+    if ratio is None:
         return char_width
+    return char_width * ratio[0] // ratio[1]
 
 
 def _scale_point(x: float, y: float,
@@ -291,6 +331,41 @@ def _scale_point(x: float, y: float,
     return scaled_x, scaled_y
 
 
+@lru_cache(maxsize=1024)
+def _stroke_offsets(dx: int, dy: int,
+                    stroke_width: int) -> tuple[tuple[int, int], ...]:
+    """
+    Distinct pixel offsets of the parallel lines making up a thick line.
+
+    Offsets depend only on the line direction and stroke width, and glyph
+    segments repeat across renders, so they are cached. Near-diagonal
+    lines can round two offsets to the same pixel; that line is only
+    drawn once.
+
+    Args:
+        dx: X extent of the line (non-degenerate)
+        dy: Y extent of the line (non-degenerate)
+        stroke_width: Width of the stroke in pixels
+
+    Returns:
+        Tuple of (ox, oy) offsets in drawing order
+    """
+    # Perpendicular direction (rotated 90 degrees), unit length
+    length = (dx * dx + dy * dy) ** 0.5
+    perp_x = -dy / length
+    perp_y = dx / length
+
+    half_width = (stroke_width - 1) / 2.0
+
+    offsets = []
+    for i in range(stroke_width):
+        offset = i - half_width
+        pair = (int(round(perp_x * offset)), int(round(perp_y * offset)))
+        if pair not in offsets:
+            offsets.append(pair)
+    return tuple(offsets)
+
+
 def _draw_thick_line(fb: Framebuffer,
                      x0: int, y0: int, x1: int, y1: int,
                      stroke_width: int, color: bool) -> None:
@@ -313,37 +388,96 @@ def _draw_thick_line(fb: Framebuffer,
         draw_line(fb, x0, y0, x1, y1, color)
         return
 
-    # Calculate line direction
     dx = x1 - x0
     dy = y1 - y0
 
-    # Calculate perpendicular direction for offset
-    # Normalize to unit length, then scale by offset
-    length = (dx * dx + dy * dy) ** 0.5
-
-    if length < 0.001:
+    if dx == 0 and dy == 0:
         # Degenerate case: start and end are the same point
-        # Draw a small filled area
+        # Draw a small filled square
         half = stroke_width // 2
-        for ox in range(-half, half + 1):
-            for oy in range(-half, half + 1):
-                fb.set_pixel(x0 + ox, y0 + oy, color)
+        fill_rect(fb, x0 - half, y0 - half, 2 * half + 1, 2 * half + 1, color)
         return
 
-    # Perpendicular direction (rotated 90 degrees)
-    perp_x = -dy / length
-    perp_y = dx / length
-
     # Draw multiple parallel lines
-    half_width = (stroke_width - 1) / 2.0
-
-    for i in range(stroke_width):
-        offset = i - half_width
-        ox = int(round(perp_x * offset))
-        oy = int(round(perp_y * offset))
+    for ox, oy in _stroke_offsets(dx, dy, stroke_width):
         draw_line(fb, x0 + ox, y0 + oy, x1 + ox, y1 + oy, color)
 
 
+@lru_cache(maxsize=512)
+def _scaled_segments(char: str, width: int,
+                     height: int) -> tuple[tuple[int, int, int, int], ...]:
+    """
+    Line segments of a glyph scaled to a bounding box at the origin.
+
+    Displays redraw the same few glyph sizes every frame, so the scaled
+    segments are cached per (char, width, height); rendering only adds
+    the box position.
+
+    Args:
+        char: Character with an entry in _GLYPHS_SOA
+        width: Width of bounding box
+        height: Height of bounding box
+
+    Returns:
+        Tuple of (x0, y0, x1, y1) segments relative to the box origin
+    """
+    xs, ys, starts = _GLYPHS_SOA[char]
+
+    # Glyph coordinates are non-negative, so for a non-negative box floor
+    # division gives the same result as _scale_point's int(x * width / 100)
+    # without going via float.
+    if width >= 0 and height >= 0:
+        scaled_xs = [px * width // 100 for px in xs]
+        scaled_ys = [py * height // 100 for py in ys]
+    else:
+        scaled_xs = [int(px * width / 100) for px in xs]
+        scaled_ys = [int(py * height / 100) for py in ys]
+
+    # Consecutive points of each stroke form its segments
+    return tuple(
+        (scaled_xs[i], scaled_ys[i], scaled_xs[i + 1], scaled_ys[i + 1])
+        for stroke in range(len(starts) - 1)
+        for i in range(starts[stroke], starts[stroke + 1] - 1)
+    )
+
+
+@lru_cache(maxsize=512)
+def _glyph_lines(char: str, width: int, height: int, stroke_width: int
+                 ) -> tuple[tuple[tuple[int, int, int, int], ...],
+                            tuple[tuple[int, int, int], ...]]:
+    """
+    Every primitive _draw_thick_line would issue for a whole glyph.
+
+    Expanding all strokes once per (char, width, height, stroke_width)
+    lets render_numeral emit the glyph as one batch of draw_line calls,
+    without per-segment stroke-width dispatch or offset lookups.
+
+    Args:
+        char: Character with an entry in _GLYPHS_SOA
+        width: Width of bounding box
+        height: Height of bounding box
+        stroke_width: Width of strokes in pixels
+
+    Returns:
+        (lines, squares): (x0, y0, x1, y1) lines and (x, y, size) filled
+        squares for zero-length segments, relative to the box origin
+    """
+    lines = []
+    squares = []
+
+    for x0, y0, x1, y1 in _scaled_segments(char, width, height):
+        if stroke_width <= 1:
+            lines.append((x0, y0, x1, y1))
+        elif x0 == x1 and y0 == y1:
+            half = stroke_width // 2
+            squares.append((x0 - half, y0 - half, 2 * half + 1))
+        else:
+            for ox, oy in _stroke_offsets(x1 - x0, y1 - y0, stroke_width):
+                lines.append((x0 + ox, y0 + oy, x1 + ox, y1 + oy))
+
+    return tuple(lines), tuple(squares)
+
+
 def render_numeral(
     fb: Framebuffer,
     char: str,
@@ -365,26 +499,73 @@ def render_numeral(
         stroke_width: Width of strokes in pixels (default 2)
         color: True for black, False for white (default True)
     """
-    if char not in GLYPHS:
-        return
+    render_numeral_batch(fb, ((char, x, y, width, height),), stroke_width, color)
 
-    strokes = GLYPHS[char]
 
-    for stroke in strokes:
-        if len(stroke) < 2:
+def render_numeral_batch(
+    fb: Framebuffer,
+    glyphs: Iterable[tuple[str, int, int, int, int]],
+    stroke_width: int = 2,
+    color: bool = True
+) -> None:
+    """
+    Render several characters with shared stroke width and color.
+
+    Same result as calling render_numeral for each entry, without a
+    Python call per character; used by the string renderers.
+
+    Args:
+        fb: Framebuffer to draw on
+        glyphs: (char, x, y, width, height) for each character
+        stroke_width: Width of strokes in pixels (default 2)
+        color: True for black, False for white (default True)
+    """
+    for char, x, y, width, height in glyphs:
+        if char not in _GLYPHS_SOA:
             continue
 
-        # Scale all points
-        scaled_points = [
-            _scale_point(px, py, x, y, width, height)
-            for px, py in stroke
-        ]
+        lines, squares = _glyph_lines(char, width, height, stroke_width)
+        for x0, y0, x1, y1 in lines:
+            draw_line(fb, x + x0, y + y0, x + x1, y + y1, color)
+        for sx, sy, size in squares:
+            fill_rect(fb, x + sx, y + sy, size, size, color)
 
-        # Draw line segments between consecutive points
-        for i in range(len(scaled_points) - 1):
-            x0, y0 = scaled_points[i]
-            x1, y1 = scaled_points[i + 1]
-            _draw_thick_line(fb, x0, y0, x1, y1, stroke_width, color)
+
+@lru_cache(maxsize=256)
+def _layout(text: str, char_width: int,
+            spacing: int) -> tuple[int, tuple[tuple[str, int, int], ...]]:
+    """
+    Lay out a string once per (text, char_width, spacing).
+
+    Clocks and labels measure and draw the same strings every frame, and
+    the centered/right-aligned helpers measure before drawing, so the
+    layout is cached.
+
+    Args:
+        text: String to lay out
+        char_width: Width of each character bounding box
+        spacing: Horizontal spacing between characters
+
+    Returns:
+        (total_width, placements) where placements holds (char, x_offset,
+        actual_width) for each drawable character, x_offset relative to
+        the left edge of the string
+    """
+    placements = []
+    current_x = 0
+
+    for char in text:
+        actual_width = _get_char_width(char, char_width)
+
+        if char in GLYPHS:
+            placements.append((char, current_x, actual_width))
+        # Spaces and unknown characters draw nothing but still advance
+
+        current_x += actual_width + spacing
+
+    # No spacing after the last character
+    total_width = current_x - spacing if text else 0
+    return total_width, tuple(placements)
 
 
 def render_string(
@@ -409,20 +590,84 @@ def render_string(
         **kwargs: Additional arguments passed to render_numeral
                   (stroke_width, color)
     """
-    current_x = x
+    render_numeral_batch(
+        fb,
+        [(char, x + offset, y, actual_width, char_height)
+         for char, offset, actual_width in _layout(text, char_width, spacing)[1]],
+        **kwargs)
 
-    for char in text:
-        actual_width = _get_char_width(char, char_width)
 
-        if char in GLYPHS:
-            render_numeral(fb, char, current_x, y, actual_width, char_height, **kwargs)
-            current_x += actual_width + spacing
-        elif char == ' ':
-            # Space advances by half character width
-            current_x += actual_width + spacing
-        else:
-            # Unknown character - skip but advance
-            current_x += char_width + spacing
+# Last render of each cached field, per framebuffer:
+# fb -> {key: (params, rect, snapshot)}. Weak, so a discarded framebuffer
+# takes its field state with it.
+_FIELD_STATE: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _field_snapshot(fb: Framebuffer, rect: tuple[int, int, int, int]) -> bytes:
+    """Packed bytes covering rect (x, y, w, h), row by row."""
+    rx, ry, rw, rh = rect
+    return b"".join(fb.get_row_bytes(row, rx, rx + rw) for row in range(ry, ry + rh))
+
+
+def render_string_cached(
+    fb: Framebuffer,
+    text: str,
+    x: int, y: int,
+    char_width: int, char_height: int,
+    key,
+    spacing: int = 4,
+    stroke_width: int = 2,
+    color: bool = True
+) -> bool:
+    """
+    Render a string field, skipping the work if it is already on screen.
+
+    Intended for fields redrawn every frame where only a few change (the
+    seconds of a clock, say). The field owns its bounding box: when the
+    text or position changes, the previous and new boxes are cleared to
+    the background before drawing. The render is skipped only when the
+    arguments match the last call for this key and the pixels under the
+    box are exactly as that call left them, so clearing or drawing over
+    the field always forces a redraw.
+
+    Args:
+        fb: Framebuffer to draw on
+        text: String to render
+        x: Left edge of first character bounding box
+        y: Top edge of bounding box
+        char_width: Width of each character bounding box
+        char_height: Height of each character bounding box
+        key: Hashable identifier for the field, scoped to fb
+        spacing: Horizontal spacing between characters (default 4)
+        stroke_width: Width of strokes in pixels (default 2)
+        color: True for black, False for white (default True)
+
+    Returns:
+        True if the string was drawn, False if the render was skipped
+    """
+    params = (text, x, y, char_width, char_height, spacing, stroke_width, color)
+    fields = _FIELD_STATE.get(fb)
+    if fields is None:
+        fields = _FIELD_STATE[fb] = {}
+    state = fields.get(key)
+    if state is not None and state[0] == params:
+        if _field_snapshot(fb, state[1]) == state[2]:
+            return False
+
+    # Thick strokes can spill past the character boxes by up to stroke_width
+    pad = max(stroke_width, 1)
+    rect = (x - pad, y - pad,
+            get_string_width(text, char_width, spacing) + 2 * pad,
+            char_height + 2 * pad)
+
+    if state is not None:
+        fill_rect(fb, *state[1], not color)
+    fill_rect(fb, *rect, not color)
+    render_string(fb, text, x, y, char_width, char_height, spacing,
+                  stroke_width=stroke_width, color=color)
+
+    fields[key] = (params, rect, _field_snapshot(fb, rect))
+    return True
 
 
 def get_string_width(
@@ -441,19 +686,7 @@ def get_string_width(
     Returns:
         Total width in pixels
     """
-    if not text:
-        return 0
-
-    total_width = 0
-
-    for i, char in enumerate(text):
-        total_width += _get_char_width(char, char_width)
-
-        # Add spacing after each character except the last
-        if i < len(text) - 1:
-            total_width += spacing
-
-    return total_width
+    return _layout(text, char_width, spacing)[0]
 
 
 def render_string_centered(
@@ -510,6 +743,54 @@ def render_string_right(
     render_string(fb, text, x, y, char_width, char_height, spacing, **kwargs)
 
 
+def _layout_block(
+    lines: list[str],
+    x: int, y: int,
+    char_width: int, char_height: int,
+    spacing: int,
+    line_spacing: int,
+    align: str
+) -> list[tuple[str, int, int, int]]:
+    """
+    Lay out a block of lines in one pass.
+
+    Each line is measured and placed from a single _layout lookup instead
+    of separate measure and draw walks.
+
+    Args:
+        lines: List of strings to lay out
+        x: X coordinate (left edge, center or right edge depending on align)
+        y: Top edge of first line
+        char_width: Width of each character bounding box
+        char_height: Height of each character bounding box
+        spacing: Horizontal spacing between characters
+        line_spacing: Vertical spacing between lines
+        align: "left", "center" or "right"
+
+    Returns:
+        (char, x, y, actual_width) for every drawable character, in
+        absolute framebuffer coordinates
+    """
+    placements = []
+    current_y = y
+
+    for line in lines:
+        total_width, line_placements = _layout(line, char_width, spacing)
+        if align == "center":
+            line_x = x - total_width // 2
+        elif align == "right":
+            line_x = x - total_width
+        else:  # left
+            line_x = x
+
+        for char, offset, actual_width in line_placements:
+            placements.append((char, line_x + offset, current_y, actual_width))
+
+        current_y += char_height + line_spacing
+
+    return placements
+
+
 def render_multiline(
     fb: Framebuffer,
     lines: list[str],
@@ -535,17 +816,10 @@ def render_multiline(
                   (stroke_width, color, spacing)
     """
     spacing = kwargs.pop('spacing', 4)
-    current_y = y
-
-    for line in lines:
-        if align == "center":
-            render_string_centered(fb, line, x, current_y, char_width, char_height,
-                                   spacing=spacing, **kwargs)
-        elif align == "right":
-            render_string_right(fb, line, x, current_y, char_width, char_height,
-                                spacing=spacing, **kwargs)
-        else:  # left
-            render_string(fb, line, x, current_y, char_width, char_height,
-                          spacing=spacing, **kwargs)
 
-        current_y += char_height + line_spacing
+    render_numeral_batch(
+        fb,
+        [(char, char_x, char_y, actual_width, char_height)
+         for char, char_x, char_y, actual_width in _layout_block(
+             lines, x, y, char_width, char_height, spacing, line_spacing, align)],
+        **kwargs)